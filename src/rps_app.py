@@ -17,25 +17,187 @@ CTkListbox==0.10
 CTkToolTip==0.8
 Pillow==10.1.0
 gTTS==2.4.0
-playsound==1.2.2
+pygame==2.5.2
+psutil==5.9.8
 
 GitHub Repository: https://github.com/LukeWait/rps-app
 """
 
 import socket
 import threading
+import time
 import hashlib
+import hmac
+import io
+import ipaddress
+import locale
 import os
 import re
+import select
+import struct
 import sys
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import psutil
 import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from CTkMessagebox import *
 from CTkListbox import *
 from CTkToolTip import *
 from tkinter import *
 from PIL import Image
 from gtts import gTTS
-from playsound import playsound
+
+# CTkMessagebox icons set by Gui.load_images as (attribute, filename)
+MESSAGEBOX_ICONS = (
+    ("icon_info", "info.png"),
+    ("icon_cancel", "cancel.png"),
+    ("icon_check", "check.png"),
+    ("icon_question", "question.png"),
+    ("icon_warning", "warning.png"),
+)
+
+# Seconds before unused cached text-to-speech audio is deleted (30 days)
+TTS_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Milliseconds after the last stats change before the profile stats are saved
+STATS_SAVE_DELAY = 5000
+
+# Digits in the zero-padded win/loss/tie counters of the user data file, allowing them to be updated in place
+STAT_WIDTH = 9
+
+# New user password requirements: at least 8 characters, one number and one symbol
+PASSWORD_RE = re.compile(r'^(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>])(.{8,})$')
+
+# Port settings: a number of at most 5 digits
+PORT_RE = re.compile(r'^\d{1,5}$')
+
+# Seconds a successfully retrieved local IP address is reused before it is looked up again
+LOCAL_IP_TTL = 5
+
+# Console text size based on the operating system
+CONSOLE_TEXT_SIZE = 11 if sys.platform == "win32" else 10
+
+# Server discovery timing in seconds: overall limit, wait for the first reply, and quiet period
+# after the latest reply before discovery is considered complete
+DISCOVERY_TIMEOUT = 5
+DISCOVERY_FIRST_REPLY = 1
+DISCOVERY_QUIET_PERIOD = 0.3
+
+# Discovery and connection request prefixes sent over the broadcast port
+LOOKUP_PREFIX = b"LOOKUP"
+CONNECT_PREFIX = b"CONNECT"
+ACK_PREFIX = b"ACK"
+
+# Translation table removing carriage returns and null characters from chat messages
+CHAT_STRIP_TABLE = str.maketrans("", "", "\r\x00")
+
+# Main textbox header shown at the start of each round
+ROUND_HEADER = "Round {round} / {total}\n**************\n"
+
+# Join listbox entry for a discovered server, filled from its (ip, port, username, total_rounds) tuple
+SERVER_ENTRY = "Username: {2}\nTotal Rounds: {3}\nIP: {0}\nPort: {1}"
+
+# Game socket frame header: 1 byte opcode followed by a 4 byte payload length
+FRAME_HEADER = struct.Struct("!BI")
+
+# Largest frame payload accepted from the other peer, larger frames drop the connection
+MAX_FRAME_SIZE = 64 * 1024
+
+# Game socket frame opcodes
+OP_DISCONNECT = 0
+OP_CHAT = 1
+OP_GAME = 2
+
+# Options shared by the avatar selection buttons in the newuser frame
+AVATAR_BUTTON_STYLE = {
+    "border_spacing": 0,
+    "text": "",
+    "width": 80,
+    "fg_color": "transparent",
+    "border_width": 0,
+    "hover_color": ("gray70", "gray30"),
+}
+
+# Game choices, numbered by their position for the GAME frame payload and result calculation
+CHOICES = ("Rock", "Paper", "Scissors")
+CHOICE_ID = {choice: i for i, choice in enumerate(CHOICES)}
+
+# Profile stat credited for each result, indexed by (player - opponent) % 3 choice IDs
+RESULT_KEYS = ("ties", "wins", "loses")
+
+# Complete GAME frames for each choice, sent as is when the player chooses
+GAME_FRAMES = {choice: FRAME_HEADER.pack(OP_GAME, 1) + bytes((i,)) for choice, i in CHOICE_ID.items()}
+
+# ASCII art line fragments drawn side by side for each game result: player hand, versus sign, opponent hand
+PLAYER_HANDS = {
+    "Rock": (
+        "    _______       ",
+        "---/   ____)      ",
+        "      (_____)     ",
+        "      (_____)     ",
+        "      (____)      ",
+        "---.__(___)       ",
+    ),
+    "Paper": (
+        "    _______       ",
+        "---/   ____)____  ",
+        "          ______) ",
+        "          _______)",
+        "         _______) ",
+        "---.__________)   ",
+    ),
+    "Scissors": (
+        "    _______       ",
+        "---/   ____)____  ",
+        "          ______) ",
+        "       __________)",
+        "      (____)      ",
+        "---.__(___)       ",
+    ),
+}
+VERSUS_SIGN = (
+    r"\ //  ",
+    " v/ S.",
+    "      ",
+    "      ",
+    "      ",
+    "      ",
+)
+OPPONENT_HANDS = {
+    "Rock": (
+        "       _______    ",
+        r"      (____   \---",
+        "     (_____)      ",
+        "     (_____)      ",
+        "      (____)      ",
+        "       (___)__.---",
+    ),
+    "Paper": (
+        "       _______    ",
+        r"  ____(____   \---",
+        " (______          ",
+        "(_______          ",
+        " (_______         ",
+        "   (__________.---",
+    ),
+    "Scissors": (
+        "       _______    ",
+        r"  ____(____   \---",
+        " (______          ",
+        "(__________       ",
+        "      (____)      ",
+        "       (___)__.---",
+    ),
+}
+
+# Result banners indexed by (player - opponent) % 3 with choices numbered Rock 0, Paper 1, Scissors 2
+RESULT_BANNERS = (
+    "                  --TIE--                 ",
+    "                --YOU WIN--               ",
+    "               --YOU LOSE--               ",
+)
 
 def resource_path(relative_path):
     """Finds the absolute path to a resource file, whether running as a PyInstaller bundle or in development.
@@ -53,11 +215,25 @@ def resource_path(relative_path):
         
     return os.path.join(base_path, relative_path)
 
-def user_data_path():
-    """Creates a directory and file in system files to store user data if they do not exist.
+def presized_image_path(images_path, filename, size):
+    """Finds the path to a copy of an image pre-resized by tools/resize_assets.py.
+
+    Args:
+        images_path (str): Path to the directory containing the source image.
+        filename (str): The name of the image file.
+        size (tuple): The display size of the image (width, height).
 
     Returns:
-        str: The full path to the user_data.txt file
+        str: The path to the pre-resized image, which may not exist.
+    """
+    name, extension = os.path.splitext(filename)
+    return os.path.join(images_path, "sized", f"{name}@{size[0]}x{size[1]}{extension}")
+
+def app_data_path():
+    """Creates a directory in system files to store application data if it does not exist.
+
+    Returns:
+        str: The full path to the application data directory
     """
     if sys.platform == "win32":
         app_data_dir = os.path.join(os.getenv('APPDATA'), "rps-app")
@@ -67,13 +243,257 @@ def user_data_path():
     if not os.path.exists(app_data_dir):
         os.makedirs(app_data_dir)
     
-    user_data = os.path.join(app_data_dir, "user_data.txt")
+    return app_data_dir
+
+def user_data_path():
+    """Creates a file in system files to store user data if it does not exist.
+
+    Returns:
+        str: The full path to the user_data.txt file
+    """
+    user_data = os.path.join(app_data_path(), "user_data.txt")
     
     if not os.path.exists(user_data):
         open(user_data, 'w').close()
     
     return user_data
 
+def interface_broadcast_addresses():
+    """Gets the IPv4 broadcast address of every network interface.
+
+    psutil doesn't report broadcast addresses on Windows, so they're worked out from the
+    interface address and netmask when missing. Loopback interfaces are skipped.
+
+    Returns:
+        list: Broadcast addresses of the interfaces that have one.
+    """
+    addresses = []
+
+    for interface_addresses in psutil.net_if_addrs().values():
+        for address in interface_addresses:
+            if address.family != socket.AF_INET or address.address.startswith("127."):
+                continue
+            broadcast = address.broadcast
+            if not broadcast and address.netmask:
+                try:
+                    network = ipaddress.IPv4Network(f"{address.address}/{address.netmask}", strict=False)
+                    broadcast = str(network.broadcast_address)
+                except ValueError as e:
+                    print(f"Error:\n{str(e)}")
+            if broadcast and broadcast not in addresses:
+                addresses.append(broadcast)
+
+    return addresses
+
+def hash_password(password):
+    """Hashes a password for storage in, and comparison with, the user data file.
+
+    Args:
+        password (str): The plain text password.
+
+    Returns:
+        str: The hex digest of the password.
+    """
+    return hashlib.blake2b(password.encode(), digest_size=32).hexdigest()
+
+def check_password(password, stored_hash):
+    """Checks a password against a hash from the user data file.
+
+    Hashes saved before the switch to BLAKE2b are SHA-256 digests, which are still accepted.
+
+    Args:
+        password (str): The plain text password.
+        stored_hash (str): The saved hex digest of the password.
+
+    Returns:
+        bool: True if the password matches the saved hash.
+    """
+    if hmac.compare_digest(hash_password(password), stored_hash):
+        return True
+    return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored_hash)
+
+def pad_stat(value):
+    """Formats a win/loss/tie counter for the user data file.
+
+    Args:
+        value (int): The counter value.
+
+    Returns:
+        str: The counter zero-padded to STAT_WIDTH digits.
+    """
+    return f"{value:0{STAT_WIDTH}d}"
+
+def format_user_record(record):
+    """Formats a user record as a line of the user data file.
+
+    Args:
+        record (list): The user record as [username, password, avatar, wins, loses, ties] strings.
+
+    Returns:
+        tuple: The encoded line, and the byte offset of the counters within it 
+            or None if they are not STAT_WIDTH digits wide.
+    """
+    line = (", ".join(record) + "\n").encode("utf-8")
+    stats_offset = None
+    if len(record) == 6 and all(len(stat) == STAT_WIDTH for stat in record[3:6]):
+        stats_offset = len(", ".join(record[:3]).encode("utf-8")) + 2
+
+    return line, stats_offset
+
+def decode_user_line(raw_line):
+    """Decodes a line of the user data file.
+
+    Lines are written as UTF-8, but files saved by earlier versions used the locale encoding
+    (cp1252 on Windows), so lines that are not valid UTF-8 are decoded with that instead.
+
+    Args:
+        raw_line (bytes): The line as read from the file.
+
+    Returns:
+        str: The decoded line.
+    """
+    try:
+        return raw_line.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw_line.decode(locale.getpreferredencoding(False), errors="replace")
+
+def create_game_socket():
+    """Creates a TCP socket configured for game and chat communications.
+
+    Nagle's algorithm is disabled so small game and chat messages are sent immediately,
+    and keepalive is enabled so dead connections are eventually detected.
+
+    Returns:
+        socket.socket: The configured TCP socket.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    configure_game_socket(sock)
+    return sock
+
+def configure_game_socket(sock):
+    """Applies the game and chat socket options to a TCP socket.
+
+    Args:
+        sock (socket.socket): The TCP socket to configure.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+def send_frame(sock, op, payload=b""):
+    """Sends a length-prefixed frame over a game socket.
+
+    Args:
+        sock (socket.socket): The connected TCP socket.
+        op (int): The frame opcode (OP_DISCONNECT, OP_CHAT or OP_GAME).
+        payload (bytes): The frame payload.
+    """
+    sock.sendall(FRAME_HEADER.pack(op, len(payload)) + payload)
+
+def recv_exactly(sock, size):
+    """Receives an exact number of bytes from a game socket.
+
+    Args:
+        sock (socket.socket): The connected TCP socket.
+        size (int): The number of bytes to receive.
+
+    Returns:
+        bytearray: The received bytes, or None if the connection closed first.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return None
+        received += count
+
+    return buffer
+
+def recv_frame(sock):
+    """Receives a single length-prefixed frame from a game socket.
+
+    Args:
+        sock (socket.socket): The connected TCP socket.
+
+    Returns:
+        tuple: The frame opcode and payload, or None if the connection closed or the frame
+            was larger than MAX_FRAME_SIZE.
+    """
+    header = recv_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    op, length = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        print(f"Error:\nFrame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+        return None
+
+    payload = recv_exactly(sock, length)
+    if payload is None:
+        return None
+
+    return op, payload
+
+def build_ascii_results():
+    """Builds the ASCII art representations of every game result.
+
+    Each result is assembled line by line from the player's hand, the versus sign and the
+    opponent's hand, followed by the result banner.
+
+    Returns:
+        tuple: ASCII art strings indexed by [player][opponent] choice IDs.
+    """
+    outcomes = []
+
+    for player_index, player in enumerate(CHOICES):
+        row = []
+        for opponent_index, opponent in enumerate(CHOICES):
+            lines = [player_line + versus_line + opponent_line for player_line, versus_line, opponent_line
+                     in zip(PLAYER_HANDS[player], VERSUS_SIGN, OPPONENT_HANDS[opponent])]
+            lines.append(RESULT_BANNERS[(player_index - opponent_index) % 3])
+            row.append("\n".join(lines) + "\n")
+        outcomes.append(tuple(row))
+
+    return tuple(outcomes)
+
+# ASCII art for each game result, indexed by [player][opponent] choice IDs
+ASCII_RESULTS = build_ascii_results()
+
+
+class LazyImage:
+    """Descriptor for a GUI image that is loaded the first time it is accessed.
+
+    The loaded image is stored on the Gui instance, so later lookups skip the descriptor.
+
+    Attributes:
+        filename (str): The name of the image file in the images directory.
+        size (tuple): The display size of the image (width, height).
+        name (str): The Gui attribute name the image is assigned to.
+    """
+
+    def __init__(self, filename, size):
+        """Initializes the LazyImage descriptor.
+
+        Args:
+            filename (str): The name of the image file in the images directory.
+            size (tuple): The display size of the image (width, height).
+        """
+        self.filename = filename
+        self.size = size
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, gui, owner=None):
+        if gui is None:
+            return self
+        image = gui.load_image(self.filename, self.size)
+        gui.__dict__[self.name] = image
+        return image
+
 
 class Gui(ctk.CTk):
     """Represents the graphical user interface.
@@ -83,16 +503,24 @@ class Gui(ctk.CTk):
     Attributes:
         images_path (str): Path to the directory containing images used in the GUI.
         audio_path (str): Path to the directory containing audio resources.
-        images_avatar (dict): Dictionary of avatar images for user selection.
+        sounds (dict): Dictionary of sound effects preloaded into memory.
+        tts_cache_path (str): Path to the directory caching synthesized text-to-speech audio.
+        images_avatar (dict): Dictionary of avatar image attribute names, keyed by avatar name.
         newuser_avatar_buttons (dict): Dictionary of avatar selection buttons.
         bg_label (ctk.CTkLabel): Label for the background image.
         audio_on (bool): Flag indicating whether audio is enabled.
         tts_on (bool): Flag indicating whether text-to-speech is enabled.
+        lobby_frame_state (str): The last state set by update_lobby_state.
+        game_frame_state (str): The last state set by update_game_state.
+        audio_executor (ThreadPoolExecutor): Worker thread for text-to-speech playback.
 
     Methods:
         __init__(): Initializes the Gui object, sets up the main window, loads images, and creates frames.
-        load_images(): Loads images used in the GUI from specified directories.
-        load_fonts(): Loads fonts used in the GUI from specified directories.
+        load_images(): Loads the paths of CTkMessagebox icons from specified directories.
+        load_image(filename, size): Loads an image used in the GUI from the images directory.
+        avatar_image(name): Gets the image of an avatar, loading it on first use.
+        load_fonts(): Loads fonts used in the GUI and creates the shared font instances.
+        load_audio(): Loads sound effects used in the GUI into memory.
         create_login_frame(): Creates and configures the login frame where users can log in.
         create_newuser_frame(): Creates and configures the new user registration frame.
         create_profile_frame(): Creates and configures the user profile frame.
@@ -101,16 +529,45 @@ class Gui(ctk.CTk):
         show_newuser_screen(): Displays the new user registration frame. Users can create a new account.
         show_main_screen(): Displays the user profile frame showing user information and options.
         show_main_frame(): Displays the main game frame containing game controls and chat functionality.
+        clear_entries(*entries): Clears the text from entry fields that aren't already empty.
         update_status_textbox(msg): Updates the status textbox with the provided message.
         update_main_textbox(msg, type): Updates the main game textbox with the provided message.
         update_lobby_state(state): Updates the state of the lobby frame and its components.
         update_game_state(state): Updates the state of the game frame and its components.
         update_lobby_slider_value(value): Updates the displayed value of the lobby host slider.
         ascii_results(player, opponent): Generates an ASCII art representation of the game result.
+        tts_cache_file(msg): Returns the path of the cached text-to-speech audio for a message.
+        prune_tts_cache(): Deletes cached text-to-speech audio that hasn't been used recently.
         text_to_speech(msg): Converts text to speech and plays the audio.
-        play_audio(sound): Plays an audio file with the specified sound.
+        play_audio(sound): Plays a preloaded sound effect.
+        stop_audio(): Cancels queued text-to-speech and stops audio that is playing.
+        destroy(): Stops audio and destroys the window.
     """
 
+    # Sound effects played for chat messages by type
+    CHAT_AUDIO = {"local_chat": "txt-send.wav", "peer_chat": "txt-receive.wav"}
+
+    # Images and icons used in GUI
+    image_bg = LazyImage("bg-gradient.jpg", (900, 600))
+    image_rps_login = LazyImage("rps-pixel.png", (250, 114))
+    image_rps_profile = LazyImage("rps-pixel.png", (110, 50))
+    icon_image = LazyImage("image-icon.png", (60, 60))
+    icon_back = LazyImage("back.png", (20, 20))
+    icon_add_user = LazyImage("add-user.png", (20, 20))
+    icon_chat = LazyImage("chat.png", (20, 20))
+    icon_connected = LazyImage("connect-yes.png", (50, 50))
+    icon_disconnected = LazyImage("connect-no.png", (50, 50))
+
+    # Avatars referenced by images_avatar dictionary
+    avatar_catdog = LazyImage("catdog.png", (60, 60))
+    avatar_chick = LazyImage("chick.png", (60, 60))
+    avatar_monkey = LazyImage("monkey.png", (60, 60))
+    avatar_penguin = LazyImage("penguin.png", (60, 60))
+    avatar_sloth = LazyImage("sloth.png", (60, 60))
+    avatar_snake = LazyImage("snake.png", (60, 60))
+    avatar_turtle = LazyImage("turtle.png", (60, 60))
+    avatar_whale = LazyImage("whale.png", (60, 60))
+
     def __init__(self):
         """Initializes the Gui object, sets up the main window, loads images, and creates frames.
 
@@ -143,20 +600,25 @@ class Gui(ctk.CTk):
             self.fonts_path = resource_path(os.path.join("..", "assets", "fonts"))
             self.audio_path = resource_path(os.path.join("..", "assets", "audio"))
 
-        # Load images and fonts
+        # Synthesized speech is cached in system files so repeated messages skip gTTS
+        self.tts_cache_path = os.path.join(app_data_path(), "tts_cache")
+        os.makedirs(self.tts_cache_path, exist_ok=True)
+
+        # Load images, fonts and sound effects
         self.load_images()
         self.load_fonts()
+        self.load_audio()
 
-        # Dictionary of avatar images
+        # Dictionary of avatar image attribute names, resolved by avatar_image when first shown
         self.images_avatar = {
-            "catdog": self.avatar_catdog,
-            "penguin": self.avatar_penguin,
-            "monkey": self.avatar_monkey,
-            "turtle": self.avatar_turtle,
-            "snake": self.avatar_snake,
-            "sloth": self.avatar_sloth,
-            "chick": self.avatar_chick,
-            "whale": self.avatar_whale,
+            "catdog": "avatar_catdog",
+            "penguin": "avatar_penguin",
+            "monkey": "avatar_monkey",
+            "turtle": "avatar_turtle",
+            "snake": "avatar_snake",
+            "sloth": "avatar_sloth",
+            "chick": "avatar_chick",
+            "whale": "avatar_whale",
         }
 
         # Dictionary of avatar selection buttons
@@ -170,6 +632,10 @@ class Gui(ctk.CTk):
         self.audio_on = True
         self.tts_on = False
 
+        # Persistent worker for text-to-speech so chat messages don't each spawn new threads
+        self.audio_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rps-audio")
+        self.audio_executor.submit(self.prune_tts_cache)
+
         # Create and show frames
         self.create_login_frame()
         self.create_newuser_frame()
@@ -178,48 +644,86 @@ class Gui(ctk.CTk):
         self.show_login_screen()
 
     def load_images(self):
-        """Loads images used in the GUI from specified directories.
+        """Loads the paths of CTkMessagebox icons from specified directories.
+
+        Images and icons displayed in the GUI are LazyImage attributes, loaded on first use.
         """
         try:
-            # Images and icons used in GUI
-            self.image_bg = ctk.CTkImage(Image.open(os.path.join(self.images_path, "bg-gradient.jpg")), size=(900, 600))
-            self.image_rps_login = ctk.CTkImage(Image.open(os.path.join(self.images_path, "rps-pixel.png")), size=(250, 114))
-            self.image_rps_profile = ctk.CTkImage(Image.open(os.path.join(self.images_path, "rps-pixel.png")), size=(110, 50))
-            self.icon_image = ctk.CTkImage(Image.open(os.path.join(self.images_path, "image-icon.png")), size=(60, 60))
-            self.icon_back = ctk.CTkImage(Image.open(os.path.join(self.images_path, "back.png")), size=(20, 20))
-            self.icon_add_user = ctk.CTkImage(Image.open(os.path.join(self.images_path, "add-user.png")), size=(20, 20))
-            self.icon_chat = ctk.CTkImage(Image.open(os.path.join(self.images_path, "chat.png")), size=(20, 20))
-            self.icon_connected = ctk.CTkImage(Image.open(os.path.join(self.images_path, "connect-yes.png")), size=(50, 50))
-            self.icon_disconnected = ctk.CTkImage(Image.open(os.path.join(self.images_path, "connect-no.png")), size=(50, 50))
-            
-            # Avatars referenced by images_avatar dictionary
-            self.avatar_catdog = ctk.CTkImage(Image.open(os.path.join(self.images_path, "catdog.png")), size=(60, 60))
-            self.avatar_chick = ctk.CTkImage(Image.open(os.path.join(self.images_path, "chick.png")), size=(60, 60))
-            self.avatar_monkey = ctk.CTkImage(Image.open(os.path.join(self.images_path, "monkey.png")), size=(60, 60))
-            self.avatar_penguin = ctk.CTkImage(Image.open(os.path.join(self.images_path, "penguin.png")), size=(60, 60))
-            self.avatar_sloth = ctk.CTkImage(Image.open(os.path.join(self.images_path, "sloth.png")), size=(60, 60))
-            self.avatar_snake = ctk.CTkImage(Image.open(os.path.join(self.images_path, "snake.png")), size=(60, 60))
-            self.avatar_turtle = ctk.CTkImage(Image.open(os.path.join(self.images_path, "turtle.png")), size=(60, 60))
-            self.avatar_whale = ctk.CTkImage(Image.open(os.path.join(self.images_path, "whale.png")), size=(60, 60))
-
-            # CTkMessagebox icons
-            self.icon_info = os.path.join(self.images_path, "info.png")
-            self.icon_cancel = os.path.join(self.images_path, "cancel.png")
-            self.icon_check = os.path.join(self.images_path, "check.png")
-            self.icon_question = os.path.join(self.images_path, "question.png")
-            self.icon_warning = os.path.join(self.images_path, "warning.png")
+            images_path = self.images_path
+            for attribute, filename in MESSAGEBOX_ICONS:
+                setattr(self, attribute, os.path.join(images_path, filename))
 
         except Exception as e:
             print(f"Error:\n{str(e)}")
+
+    def load_image(self, filename, size):
+        """Loads an image used in the GUI from the images directory.
+
+        Args:
+            filename (str): The name of the image file.
+            size (tuple): The display size of the image (width, height).
+
+        Returns:
+            ctk.CTkImage: The loaded image, or None if it could not be loaded.
+        """
+        try:
+            # Use the pre-resized copy of the image when it's displayed without scaling
+            images_path = self.images_path
+            scaling = self._get_window_scaling()
+            image_path = presized_image_path(images_path, filename, size)
+            if scaling != 1 or not os.path.exists(image_path):
+                image_path = os.path.join(images_path, filename)
+
+            image = Image.open(image_path)
+            # JPEGs are decoded at the smallest DCT scale still covering the displayed size
+            image.draft("RGB", (int(size[0] * scaling), int(size[1] * scaling)))
+            return ctk.CTkImage(image, size=size)
+
+        except Exception as e:
+            print(f"Error:\n{str(e)}")
+
+    def avatar_image(self, name):
+        """Gets the image of an avatar, loading it on first use.
+
+        Args:
+            name (str): The avatar name, a key of images_avatar.
+
+        Returns:
+            ctk.CTkImage: The avatar image, or None for an unknown avatar.
+        """
+        attribute = self.images_avatar.get(name)
+        return getattr(self, attribute) if attribute else None
     
     def load_fonts(self):
         """Loads fonts used in the GUI from specified directories.
+
+        Creates the font instances shared by the GUI widgets.
         """
         try:
             ctk.FontManager.load_font(os.path.join(self.fonts_path, "HARLOWSI.TTF"))
             
         except Exception as e:
             print(f"Error:\n{str(e)}")
+
+        # Fonts used in GUI
+        self.font_heading = ctk.CTkFont(size=20, weight="bold")
+        self.font_profile = ctk.CTkFont(family="Harlow Solid Italic", size=36, weight="bold")
+        self.font_profile_stats = ctk.CTkFont(family="Harlow Solid Italic", size=18)
+        self.font_console = ctk.CTkFont(family="Consolas", size=CONSOLE_TEXT_SIZE)
+
+    def load_audio(self):
+        """Loads sound effects used in the GUI into memory.
+
+        Sounds are decoded once here so playback doesn't touch the disk.
+        """
+        self.sounds = {}
+        try:
+            pygame.mixer.init()
+            for sound in ("txt-send.wav", "txt-receive.wav"):
+                self.sounds[sound] = pygame.mixer.Sound(os.path.join(self.audio_path, sound))
+
+        except Exception as e:
+            print(f"Error:\n{str(e)}")
     
     def create_login_frame(self):
         """Creates and configures the login frame.
@@ -257,7 +761,7 @@ class Gui(ctk.CTk):
 
         # Configure newuser frame widgets
         self.newuser_label = ctk.CTkLabel(self.newuser_frame, text="Choose your warrior:",
-                                                  font=ctk.CTkFont(size=20, weight="bold"))
+                                                  font=self.font_heading)
         self.newuser_label.grid(row=0, column=0, columnspan=2, padx=30, pady=(30, 15))
         self.newuser_username = ctk.CTkEntry(self.newuser_frame, width=200, placeholder_text="Username")
         self.newuser_username.grid(row=7, column=0, columnspan=2, padx=50, pady=(0, 15))
@@ -272,14 +776,13 @@ class Gui(ctk.CTk):
         self.newuser_save_button = ctk.CTkButton(self.newuser_frame, text="Save New User", width=130)
         self.newuser_save_button.grid(row=10, column=0, columnspan=2, padx=(0, 50), pady=(15, 30), sticky="e")
 
-        # Enumerate through the images_avatar dictionary to create newuser_avatar_buttons
-        for i, (avatar_name, avatar_image) in enumerate(self.images_avatar.items()):
-            self.avatar_buttons = ctk.CTkButton(master=self.newuser_frame, border_spacing=0, text="", width=80, 
-                                                   fg_color="transparent", image=avatar_image, border_width=0,
-                                                   hover_color=("gray70", "gray30"))
-            self.avatar_buttons.grid(row=(i % 4) + 1, column=i // 4, padx=25, pady=(0, 15), sticky="ew")
+        # Enumerate through the images_avatar dictionary to create newuser_avatar_buttons,
+        # their images are set by show_newuser_screen so they only load if the frame is shown
+        for i, avatar_name in enumerate(self.images_avatar):
+            avatar_button = ctk.CTkButton(master=self.newuser_frame, **AVATAR_BUTTON_STYLE)
+            avatar_button.grid(row=(i % 4) + 1, column=i // 4, padx=25, pady=(0, 15), sticky="ew")
             # Save to the newuser_avatar_buttons dictionary
-            self.newuser_avatar_buttons[avatar_name] = self.avatar_buttons
+            self.newuser_avatar_buttons[avatar_name] = avatar_button
 
     def create_profile_frame(self):
         """Creates and configures the user profile frame.
@@ -292,11 +795,11 @@ class Gui(ctk.CTk):
 
         # Configure profile frame widgets
         self.profile_button = ctk.CTkButton(self.profile_frame, text="", fg_color="transparent", image=self.icon_image,
-                                                      font=ctk.CTkFont(family="Harlow Solid Italic", size=36, weight="bold"), 
+                                                      font=self.font_profile, 
                                                       width=50, border_spacing=0, hover_color=("gray70", "gray30"))
         self.profile_button.grid(row=0, column=0, padx=(15, 0), pady=15)
         self.profile_button_tooltip = CTkToolTip(self.profile_button, delay=0.5, message="Profile options")
-        self.profile_winloss_label = ctk.CTkLabel(self.profile_frame, text="", font=ctk.CTkFont(family="Harlow Solid Italic", size=18))
+        self.profile_winloss_label = ctk.CTkLabel(self.profile_frame, text="", font=self.font_profile_stats)
         self.profile_winloss_label.grid(row=0, column=1, padx=5, pady=0)
         self.profile_rps_label = ctk.CTkLabel(self.profile_frame, text="", image=self.image_rps_profile)
         self.profile_rps_label.grid(row=0, column=2, padx=(0, 20), pady=15, sticky="e")
@@ -310,12 +813,6 @@ class Gui(ctk.CTk):
         The lobby frame is a tabbed frame that facilitates network connections and application settings.
         The status frame displays the current state of connectivity.
         """
-        # Determine the console text size based on the operating system
-        if sys.platform == "win32":
-            text_size = 11
-        else:
-            text_size = 10
-    
         # Configure the main frame
         self.main_frame = ctk.CTkFrame(self, corner_radius=0, width=600)
         self.main_frame.grid_rowconfigure(0, weight=1)
@@ -329,9 +826,9 @@ class Gui(ctk.CTk):
         # Configure the game frame widgets
         self.game_rps_button = ctk.CTkSegmentedButton(self.game_frame, state="disabled")
         self.game_rps_button.grid(row=0, column=0, columnspan=2, padx=(15, 7.5), pady=(10, 15), sticky="ew")
-        self.game_rps_button.configure(values=["Rock", "Paper", "Scissors"])
+        self.game_rps_button.configure(values=list(CHOICES))
         self.game_textbox = ctk.CTkTextbox(self.game_frame, state="disabled", width=277.5, fg_color="gray8",
-                                           font=ctk.CTkFont(family="Consolas", size=text_size), wrap=WORD)
+                                           font=self.font_console, wrap=WORD)
         self.game_textbox.grid(row=1, column=0, columnspan=2, padx=(15, 7.5), pady=0, sticky="nsew")
         self.game_chatbox = ctk.CTkEntry(self.game_frame, placeholder_text="Chat here...", state="disabled")
         self.game_chatbox.grid(row=2, column=0, padx=(15, 0), pady=15, sticky="ew")
@@ -360,7 +857,7 @@ class Gui(ctk.CTk):
         self.lobby_frame.tab("Settings").grid_rowconfigure(4, weight=1)
 
         # Configure the join tab widgets
-        self.lobby_join_listbox = CTkListbox(self.lobby_frame.tab("Join"), font=("Consolas", text_size), fg_color="gray8", justify="center")
+        self.lobby_join_listbox = CTkListbox(self.lobby_frame.tab("Join"), font=("Consolas", CONSOLE_TEXT_SIZE), fg_color="gray8", justify="center")
         self.lobby_join_listbox.grid(row=0, column=0, columnspan=2, padx=15, pady=(5, 0), sticky="new")
         self.lobby_join_search_button = ctk.CTkButton(self.lobby_frame.tab("Join"), text="Search", width=80)
         self.lobby_join_search_button.grid(row=1, column=0, padx=15, pady=(20, 15), sticky="e")
@@ -370,7 +867,7 @@ class Gui(ctk.CTk):
         # Configure the host tab widgets
         self.lobby_host_ip_label = ctk.CTkLabel(self.lobby_frame.tab("Host"), text="Local IP")
         self.lobby_host_ip_label.grid(row=0, column=0, columnspan=2, padx=15, pady=(15, 0))
-        self.lobby_host_ip_label2 = ctk.CTkLabel(self.lobby_frame.tab("Host"), text="", font=ctk.CTkFont(size=20, weight="bold"))
+        self.lobby_host_ip_label2 = ctk.CTkLabel(self.lobby_frame.tab("Host"), text="", font=self.font_heading)
         self.lobby_host_ip_label2.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 15))
         self.lobby_host_rounds_label = ctk.CTkLabel(self.lobby_frame.tab("Host"), text="Rounds to play")
         self.lobby_host_rounds_label.grid(row=2, column=0, columnspan=2, padx=15, pady=(15, 5))
@@ -413,10 +910,10 @@ class Gui(ctk.CTk):
         self.status_frame.grid_columnconfigure(0, weight=1)
 
         # Configure the status frame widgets
-        self.status_connection_label = ctk.CTkLabel(self.status_frame, text="Connection Status", font=ctk.CTkFont(size=20, weight="bold"))
+        self.status_connection_label = ctk.CTkLabel(self.status_frame, text="Connection Status", font=self.font_heading)
         self.status_connection_label.grid(row=0, column=0, columnspan=2, padx=0, pady=15)
         self.status_textbox = ctk.CTkTextbox(self.status_frame, height=80, state="disabled", width=165, fg_color="gray8",
-                                             font=ctk.CTkFont(family="Consolas", size=text_size))
+                                             font=self.font_console)
         self.status_textbox.grid(row=1, column=0, padx=(15, 0), pady=0, sticky="w")
         self.status_connection_button = ctk.CTkButton(self.status_frame, text="", fg_color="transparent", image=self.icon_disconnected, 
                                                          border_spacing=6, width=50, hover_color=("gray70", "gray30"),
@@ -427,6 +924,13 @@ class Gui(ctk.CTk):
         self.status_progressbar.grid(row=2, column=0, columnspan=2, padx=15, pady=15, sticky="ew")
         self.status_progressbar.configure(mode="indeterminate")
 
+        # Widgets enabled and disabled together by update_lobby_state and update_game_state
+        self.lobby_toggle_widgets = (self.lobby_frame, self.lobby_join_search_button, self.lobby_host_button,
+                                     self.lobby_host_refresh_button, self.lobby_host_slider)
+        self.game_toggle_widgets = (self.game_rps_button, self.game_chat_button, self.game_chatbox)
+        self.lobby_frame_state = None
+        self.game_frame_state = None
+
     def show_login_screen(self):
         """Displays the login frame.
         """
@@ -435,24 +939,19 @@ class Gui(ctk.CTk):
         self.main_frame.grid_forget()
         self.login_frame.grid(row=0, column=0, rowspan=2, sticky="ns")
         self.login_button.focus_set()
-        self.login_username.delete(0, END)
-        self.login_username.configure(placeholder_text="Username")
-        self.login_password.delete(0, END)
-        self.login_password.configure(placeholder_text="Password")
+        self.clear_entries(self.login_username, self.login_password)
 
     def show_newuser_screen(self):
         """Displays the newuser frame.
         """
         self.login_frame.grid_forget()
         self.main_frame.grid_forget()
+        for avatar_name, avatar_button in self.newuser_avatar_buttons.items():
+            if avatar_button.cget("image") is None:
+                avatar_button.configure(image=self.avatar_image(avatar_name))
         self.newuser_frame.grid(row=0, column=0, rowspan=2, sticky="ns")
         self.newuser_save_button.focus_set()
-        self.newuser_username.delete(0, END)
-        self.newuser_username.configure(placeholder_text="Username")
-        self.newuser_password.delete(0, END)
-        self.newuser_password.configure(placeholder_text="Password")
-        self.newuser_password2.delete(0, END)
-        self.newuser_password2.configure(placeholder_text="Repeat password")
+        self.clear_entries(self.newuser_username, self.newuser_password, self.newuser_password2)
 
     def show_main_screen(self):
         """Displays the user profile and main frames.
@@ -463,6 +962,20 @@ class Gui(ctk.CTk):
         self.main_frame.grid(row=1, column=0, sticky="ns")
         self.lobby_join_search_button.focus_set()
 
+    def clear_entries(self, *entries):
+        """Clears the text from entry fields, skipping any that are already empty.
+
+        Placeholder text is restored explicitly, as entries that were never focused
+        don't restore it themselves after delete.
+
+        Args:
+            *entries (ctk.CTkEntry): The entry fields to clear.
+        """
+        for entry in entries:
+            if entry.get():
+                entry.delete(0, END)
+                entry.configure(placeholder_text=entry.cget("placeholder_text"))
+
     def update_status_textbox(self, msg):
         """Updates the status textbox with the provided message.
 
@@ -485,72 +998,67 @@ class Gui(ctk.CTk):
             msg (str): The message to display in the game textbox.
             type (str): The type of message (e.g., "local_chat", "peer_chat", "system_chat").
         """
+        if type not in ("system_chat", "local_chat", "peer_chat"):
+            return
+
+        self.game_textbox.configure(state="normal")
         if type == "system_chat":
-            self.game_textbox.configure(state="normal")
             self.game_textbox.insert(END, msg, type)
-            self.game_textbox.insert(END, "\n")
-            self.game_textbox.see(END)
-            self.game_textbox.configure(state="disabled")
-        elif type == "local_chat" or type == "peer_chat":
-            self.game_textbox.configure(state="normal")
+        else:
             self.game_textbox.insert(END, msg + "\n", type)
-            self.game_textbox.insert(END, "\n")
-            self.game_textbox.see(END)
-            self.game_textbox.configure(state="disabled")
+        self.game_textbox.insert(END, "\n")
+        self.game_textbox.see(END)
+        self.game_textbox.configure(state="disabled")
+
+        if type in ("local_chat", "peer_chat"):
             self.game_chatbox.delete(0, END)
             
-            # Start text-to-speech and audio in separate threads
+            # Run text-to-speech on the audio worker thread, sound effects play asynchronously
             if self.tts_on:
-                tts = threading.Thread(target=lambda: self.text_to_speech(msg))
-                tts.start()
-
-            txt_audio = {"local_chat": "txt-send.mp3", "peer_chat": "txt-receive.mp3"}    
+                self.audio_executor.submit(self.text_to_speech, msg)
             if self.audio_on:
-                audio = threading.Thread(target=lambda: self.play_audio(txt_audio[type]))
-                audio.start()
+                self.play_audio(self.CHAT_AUDIO[type])
 
     def update_lobby_state(self, state):
         """Updates the state of the lobby frame and its components.
 
+        Does nothing if the lobby is already in the requested state.
+
         Args:
             state (str): The state to set ("normal" or "disabled").
         """
+        if state == self.lobby_frame_state:
+            return
+        self.lobby_frame_state = state
+
         if state == "normal":
             self.status_connection_button.configure(image=self.icon_disconnected, state="disabled")
             self.status_progressbar.stop()
-            self.lobby_frame.configure(state="normal")
-            self.lobby_join_search_button.configure(state="normal")
-            self.lobby_host_button.configure(state="normal")
-            self.lobby_host_refresh_button.configure(state="normal")
-            self.lobby_host_slider.configure(state="normal")
         elif state == "disabled":
             self.status_connection_button.configure(image=self.icon_connected, state="normal")
             self.status_progressbar.start()
-            self.lobby_frame.configure(state="disabled")
             self.lobby_join_button.configure(state="disabled")
-            self.lobby_join_search_button.configure(state="disabled")
             if self.lobby_join_listbox.size() > 0:
                 self.lobby_join_listbox.delete(0, END)
-            self.lobby_host_button.configure(state="disabled")
-            self.lobby_host_refresh_button.configure(state="disabled")
-            self.lobby_host_slider.configure(state="disabled")
+
+        for widget in self.lobby_toggle_widgets:
+            widget.configure(state=state)
 
     def update_game_state(self, state):
         """Updates the state of the game frame and its components.
 
+        Does nothing if the game frame is already in the requested state.
+
         Args:
             state (str): The state to set ("normal" or "disabled").
         """
-        if state == "normal":
-            self.game_rps_button.configure(state="normal")
-            self.game_rps_button.set("unselect")
-            self.game_chat_button.configure(state="normal")
-            self.game_chatbox.configure(state="normal")
-        elif state == "disabled":
-            self.game_rps_button.configure(state="disabled")
-            self.game_rps_button.set("unselect")
-            self.game_chat_button.configure(state="disabled")
-            self.game_chatbox.configure(state="disabled")
+        if state == self.game_frame_state:
+            return
+        self.game_frame_state = state
+
+        for widget in self.game_toggle_widgets:
+            widget.configure(state=state)
+        self.game_rps_button.set("unselect")
 
     def update_lobby_slider_value(self, value):
         """Updates the displayed tooltip value of the lobby host slider.
@@ -560,8 +1068,9 @@ class Gui(ctk.CTk):
         """
         self.lobby_host_slider_tooltip.configure(message=int(value))
 
-    def ascii_results(self, player, opponent):
-        """Generates an ASCII art representation of the game result.
+    @staticmethod
+    def ascii_results(player, opponent):
+        """Looks up the ASCII art representation of the game result.
 
         Args:
             player (str): The player's choice ("Rock", "Paper", or "Scissors").
@@ -570,114 +1079,99 @@ class Gui(ctk.CTk):
         Returns:
             str: The ASCII art representation of the game result.
         """
-        rock_scissors =     f"    _______       \ //         _______    \n" \
-                            f"---/   ____)       v/ S.  ____(____   \---\n" \
-                            f"      (_____)            (______          \n" \
-                            f"      (_____)           (__________       \n" \
-                            f"      (____)                  (____)      \n" \
-                            f"---.__(___)                    (___)__.---\n" \
-                            f"                --YOU WIN--               \n"
-        
-        rock_paper =        f"    _______       \ //         _______    \n" \
-                            f"---/   ____)       v/ S.  ____(____   \---\n" \
-                            f"      (_____)            (______          \n" \
-                            f"      (_____)           (_______          \n" \
-                            f"      (____)             (_______         \n" \
-                            f"---.__(___)                (__________.---\n" \
-                            f"               --YOU LOSE--               \n"
-        
-        rock_rock =         f"    _______       \ //         _______    \n" \
-                            f"---/   ____)       v/ S.      (____   \---\n" \
-                            f"      (_____)                (_____)      \n" \
-                            f"      (_____)                (_____)      \n" \
-                            f"      (____)                  (____)      \n" \
-                            f"---.__(___)                    (___)__.---\n" \
-                            f"                  --TIE--                 \n"
-        
-        paper_rock =        f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.      (____   \---\n" \
-                            f"          ______)            (_____)      \n" \
-                            f"          _______)           (_____)      \n" \
-                            f"         _______)             (____)      \n" \
-                            f"---.__________)                (___)__.---\n" \
-                            f"                --YOU WIN--               \n"
-        
-        paper_scissors =    f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.  ____(____   \---\n" \
-                            f"          ______)        (______          \n" \
-                            f"          _______)      (__________       \n" \
-                            f"         _______)             (____)      \n" \
-                            f"---.__________)                (___)__.---\n" \
-                            f"               --YOU LOSE--               \n"
-
-        paper_paper =       f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.  ____(____   \---\n" \
-                            f"          ______)        (______          \n" \
-                            f"          _______)      (_______          \n" \
-                            f"         _______)        (_______         \n" \
-                            f"---.__________)            (__________.---\n" \
-                            f"                  --TIE--                 \n"
-        
-        scissors_paper =    f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.  ____(____   \---\n" \
-                            f"          ______)        (______          \n" \
-                            f"       __________)      (_______          \n" \
-                            f"      (____)             (_______         \n" \
-                            f"---.__(___)                (__________.---\n" \
-                            f"                --YOU WIN--               \n"
-
-        scissors_rock =     f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.      (____   \---\n" \
-                            f"          ______)            (_____)      \n" \
-                            f"       __________)           (_____)      \n" \
-                            f"      (____)                  (____)      \n" \
-                            f"---.__(___)                    (___)__.---\n" \
-                            f"               --YOU LOSE--               \n"
-
-        scissors_scissors = f"    _______       \ //         _______    \n" \
-                            f"---/   ____)____   v/ S.  ____(____   \---\n" \
-                            f"          ______)        (______          \n" \
-                            f"       __________)      (__________       \n" \
-                            f"      (____)                  (____)      \n" \
-                            f"---.__(___)                    (___)__.---\n" \
-                            f"                  --TIE--                 \n"
-
-        # Dictionary references ASCII art based on outcome
-        outcomes = {
-            ("Rock", "Scissors"): rock_scissors,
-            ("Rock", "Paper"): rock_paper,
-            ("Rock", "Rock"): rock_rock,
-            ("Paper", "Rock"): paper_rock,
-            ("Paper", "Scissors"): paper_scissors,
-            ("Paper", "Paper"): paper_paper,
-            ("Scissors", "Paper"): scissors_paper,
-            ("Scissors", "Rock"): scissors_rock,
-            ("Scissors", "Scissors"): scissors_scissors
-        }
+        return ASCII_RESULTS[CHOICE_ID[player]][CHOICE_ID[opponent]]
+
+    @lru_cache(maxsize=64)
+    def tts_cache_file(self, msg):
+        """Returns the path of the cached text-to-speech audio for a message.
+
+        Args:
+            msg (str): The text message converted to speech.
+
+        Returns:
+            str: The path to the audio file, named by the SHA-256 hash of the message.
+        """
+        key = hashlib.sha256(msg.encode("utf-8")).hexdigest()
+        return os.path.join(self.tts_cache_path, f"{key}.mp3")
 
-        return outcomes.get((player, opponent))
+    def prune_tts_cache(self):
+        """Deletes cached text-to-speech audio that hasn't been used within TTS_CACHE_MAX_AGE.
+        """
+        expiry = time.time() - TTS_CACHE_MAX_AGE
+        try:
+            with os.scandir(self.tts_cache_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < expiry:
+                        os.remove(entry.path)
+
+        except Exception as e:
+            print(f"Error:\n{str(e)}")
 
     def text_to_speech(self, msg):
-        """Converts text to speech and plays the audio file.
+        """Converts text to speech and plays the audio.
+
+        Audio is only requested from gTTS when the message isn't already cached.
+        Newly synthesized audio is played straight from memory rather than re-read from disk.
 
         Args:
             msg (str): The text message to convert to speech and play.
         """
-        myobj = gTTS(text=msg, lang="en", slow=False)
-        audio_file = os.path.join(self.audio_path, "chat-to-speech.mp3")
-        if os.path.exists(audio_file):
-            os.remove(audio_file)
-        myobj.save(audio_file)
-        playsound(audio_file)
+        if not pygame.mixer.get_init():
+            return
+
+        audio_file = self.tts_cache_file(msg)
+        try:
+            if os.path.exists(audio_file):
+                # Refresh the modified time so frequently spoken messages aren't pruned
+                os.utime(audio_file)
+                try:
+                    pygame.mixer.music.load(audio_file)
+                except Exception:
+                    # Remove the unplayable cache entry so it's synthesized again next time
+                    os.remove(audio_file)
+                    raise
+            else:
+                # Play the synthesized audio from memory and save a copy to the cache,
+                # writing to a temporary file first so a partial write is never cached
+                audio = io.BytesIO()
+                gTTS(text=msg, lang="en", slow=False).write_to_fp(audio)
+                temp_file = f"{audio_file}.tmp"
+                with open(temp_file, "wb") as file:
+                    file.write(audio.getbuffer())
+                os.replace(temp_file, audio_file)
+                audio.seek(0)
+                pygame.mixer.music.load(audio, "mp3")
+
+            # Block this audio worker until playback ends so messages are spoken in order
+            pygame.mixer.music.play()
+            while pygame.mixer.music.get_busy():
+                pygame.time.wait(50)
+
+        except Exception as e:
+            print(f"Error:\n{str(e)}")
 
     def play_audio(self, sound):
-        """Plays an audio file with the specified sound.
+        """Plays a preloaded sound effect without blocking.
 
         Args:
             sound (str): The name of the audio file to play.
         """
-        audio_file = os.path.join(self.audio_path, sound)
-        playsound(audio_file)
+        if sound in self.sounds:
+            self.sounds[sound].play()
+
+    def stop_audio(self):
+        """Cancels any queued text-to-speech and stops audio that is playing.
+        """
+        self.audio_executor.shutdown(wait=False, cancel_futures=True)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+
+    def destroy(self):
+        """Stops audio before destroying the window, so exiting doesn't wait on queued speech.
+        """
+        self.stop_audio()
+        super().destroy()
 
 
 class Network:
@@ -686,13 +1180,18 @@ class Network:
     Attributes:
         gui (Gui): Reference to the shared Gui instance.
         local_ip (str): Local IP address.
+        local_ip_time (float): Monotonic time the local IP address was last retrieved, or None.
         server_port (int): Default server port.
         broadcast_port (int): Port for broadcasting.
-        broadcast_address (str): Broadcast address for server discovery.
+        broadcast_addresses (list): Broadcast addresses of every interface for server discovery.
+        wakeup_receiver (socket.socket): Socket watched during discovery so it can be cancelled.
+        wakeup_sender (socket.socket): Socket written to by cancel_discovery to wake discovery.
 
     Methods:
-        get_local_ip(): Retrieves the local IP address and calculates the broadcast address.
+        get_local_ip(force=False): Retrieves the local IP address and the broadcast addresses.
         discover_servers(): Discovers available servers on the network.
+        cancel_discovery(): Cancels a running server discovery.
+        drain_wakeup(): Discards pending cancellation wakeups.
     """
 
     def __init__(self, gui):
@@ -703,26 +1202,42 @@ class Network:
         """
         self.gui = gui
         self.local_ip = None
-        self.broadcast_address = None
+        self.local_ip_time = None
+        self.broadcast_addresses = []
         self.server_port = 51515
         self.broadcast_port = 12121
+        self.wakeup_receiver, self.wakeup_sender = socket.socketpair()
+        self.wakeup_receiver.setblocking(False)
+
+    def get_local_ip(self, force=False):
+        """Retrieves the local IP address and the broadcast addresses of every interface.
+
+        The broadcast address calculated from the local IP is used when no interface reports one.
+        Addresses retrieved within the last LOCAL_IP_TTL seconds are reused unless forced.
+
+        Args:
+            force (bool): Retrieve the addresses even if recent ones are available. Default is False.
+        """
+        if not force and self.local_ip_time is not None and time.monotonic() - self.local_ip_time < LOCAL_IP_TTL:
+            return
 
-    def get_local_ip(self):
-        """Retrieves the local IP address and calculates the broadcast address.
-        """    
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             sock.connect(("8.8.8.8", 80)) # Connect to a remote server
             self.local_ip = sock.getsockname()[0]
-            ip_parts = self.local_ip.split('.')
-            ip_parts[3] = '255' # Calculate the broadcast address
-            self.broadcast_address = '.'.join(ip_parts)
+            self.broadcast_addresses = interface_broadcast_addresses()
+            if not self.broadcast_addresses:
+                ip_parts = self.local_ip.split('.')
+                ip_parts[3] = '255' # Calculate the broadcast address
+                self.broadcast_addresses = ['.'.join(ip_parts)]
+            self.local_ip_time = time.monotonic()
             
         except Exception as e:
             CTkMessagebox(title="IP Retrieval Failed", message=f"An error occurred:\n{str(e)}", 
                             icon=self.gui.icon_cancel, master=self.gui, sound=True)
             self.local_ip = "No IP Found"
-            self.broadcast_address = None
+            self.local_ip_time = None
+            self.broadcast_addresses = []
 
         finally:
             sock.close()
@@ -730,6 +1245,8 @@ class Network:
     def discover_servers(self):
         """Discovers available servers on the network.
 
+        Returns early with the servers found so far if cancel_discovery is called.
+
         Returns:
             list: List of available servers with their details.
                 Each entry is a tuple (server_ip, server_port, username, total_rounds).
@@ -739,30 +1256,156 @@ class Network:
         try:
             udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            udp_socket.sendto(b"LOOKUP", (self.broadcast_address, self.broadcast_port))
-            udp_socket.settimeout(5)
-
-            while True:
+            self.drain_wakeup()
+            for broadcast_address in self.broadcast_addresses:
                 try:
-                    data, addr = udp_socket.recvfrom(1024)
-                    data_values = data.decode('utf-8').split(',')
-                    if len(data_values) == 3:
-                        server_port, username, total_rounds = data_values
-                        available_servers.append((addr[0], server_port, username, total_rounds))
-                        
-                except socket.timeout:
-                    break  # Timeout reached, stop receiving
+                    udp_socket.sendto(LOOKUP_PREFIX, (broadcast_address, self.broadcast_port))
+                except OSError as e:
+                    print(f"Error:\n{str(e)}") # Keep searching the other interfaces
+
+            # Stop receiving once servers have stopped replying or the overall timeout is reached
+            now = time.monotonic()
+            deadline = now + DISCOVERY_TIMEOUT
+            quiet_until = now + DISCOVERY_FIRST_REPLY
+
+            while now < quiet_until:
+                readable, _, _ = select.select([udp_socket, self.wakeup_receiver], [], [], quiet_until - now)
+                if not readable:
+                    break
+                if self.wakeup_receiver in readable:
+                    self.drain_wakeup()
+                    break
+
+                data, addr = udp_socket.recvfrom(1024)
+                data_values = data.decode('utf-8').split(',')
+                if len(data_values) == 3:
+                    server_port, username, total_rounds = data_values
+                    server = (addr[0], server_port, username, total_rounds)
+                    # Servers reachable through several interfaces reply once per lookup
+                    if server not in available_servers:
+                        available_servers.append(server)
+
+                now = time.monotonic()
+                quiet_until = min(now + DISCOVERY_QUIET_PERIOD, deadline)
 
         except Exception as e:
-            CTkMessagebox(title="Server Lookup Failed", message=f"Error:\n{str(e)}", 
-                            icon=self.gui.icon_cancel, master=self.gui, sound=True)
+            # Runs on a worker thread, so the messagebox is shown from the GUI thread
+            message = f"Error:\n{str(e)}"
+            self.gui.after(0, lambda: CTkMessagebox(title="Server Lookup Failed", message=message, 
+                                                    icon=self.gui.icon_cancel, master=self.gui, sound=True))
         
         finally:
             udp_socket.close()
             return available_servers
 
+    def cancel_discovery(self):
+        """Cancels a running server discovery by waking its select loop.
+        """
+        self.wakeup_sender.send(b"\0")
+
+    def drain_wakeup(self):
+        """Discards pending cancellation wakeups so they don't cancel the next discovery.
+        """
+        try:
+            while self.wakeup_receiver.recv(1024):
+                pass
+        except BlockingIOError:
+            pass
+
+
+class Peer:
+    """Base class for the network peers, handling messages received over the game socket.
+
+    Attributes:
+        app (App): Reference to the App instance.
+        gui (Gui): Reference to the Gui instance.
+        network (Network): Reference to the Network instance.
+        client_socket (socket.socket): Socket for game and chat communication with the other peer.
+        udp_socket (socket.socket): UDP socket for broadcast messages.
+        handlers (dict): Frame handlers keyed by opcode.
+
+    Methods:
+        message_loop(): Receives frames and dispatches them to their handlers.
+        handle_disconnect(payload): Handles a disconnect message from the other peer.
+        handle_chat(payload): Handles a chat message from the other peer.
+        handle_game(payload): Handles a game choice from the other peer.
+    """
 
-class Server:
+    def __init__(self, app, gui, network):
+        """Initializes the Peer instance.
+
+        Args:
+            app (App): Reference to the App instance.
+            gui (Gui): Reference to the Gui instance.
+            network (Network): Reference to the Network instance.
+        """
+        self.app = app
+        self.gui = gui
+        self.network = network
+        self.client_socket = None
+        self.udp_socket = None
+        self.handlers = {
+            OP_DISCONNECT: self.handle_disconnect,
+            OP_CHAT: self.handle_chat,
+            OP_GAME: self.handle_game,
+        }
+
+    def message_loop(self):
+        """Receives frames from the other peer and dispatches them to their handlers.
+
+        Returns when the connection closes or a handler ends the session.
+        """
+        while True:
+            frame = recv_frame(self.client_socket)
+            if frame is None:
+                break
+
+            op, payload = frame
+            handler = self.handlers.get(op)
+            if handler and handler(payload):
+                break
+
+    def handle_disconnect(self, payload):
+        """Handles a disconnect message from the other peer.
+
+        Args:
+            payload (bytearray): The game state at the time of disconnection.
+
+        Returns:
+            bool: True to end the message loop.
+        """
+        game_state = payload.decode("utf-8")
+        if game_state == "mid_game":
+            self.app.gui.after(0, self.app.dropout_resolution, "player")
+        return True
+
+    def handle_chat(self, payload):
+        """Handles a chat message from the other peer.
+
+        Args:
+            payload (bytearray): The chat message.
+        """
+        msg = payload.decode("utf-8").translate(CHAT_STRIP_TABLE)
+        self.app.gui.after(0, self.app.network_chat, msg, "peer_chat")
+
+    def handle_game(self, payload):
+        """Handles a game choice from the other peer.
+
+        Args:
+            payload (bytearray): The opponent's choice ID as a single byte.
+        """
+        if len(payload) != 1 or payload[0] >= len(CHOICES):
+            return
+
+        self.app.opponent_choice = CHOICES[payload[0]]
+        if self.app.player_choice:
+            self.app.gui.after(0, self.app.determine_results)
+        else:
+            self.app.gui.after(0, self.app.network_chat, 
+                               f"{self.app.opponent_username} has chosen...\n", "system_chat")
+
+
+class Server(Peer):
     """Manages server-side network communication.
 
     Attributes:
@@ -773,12 +1416,13 @@ class Server:
         server_socket (socket.socket): Server socket for handling client connections.
         client_socket (socket.socket): Client socket for communication with connected client.
         udp_socket (socket.socket): UDP socket for broadcasting and listening to broadcast messages.
+        stop_event (threading.Event): Set to stop listening for broadcast messages.
 
     Methods:
         start(): Starts the server and waits for client connections.
         stop(game_state): Stops the server and sends a disconnect message to the client.
         broadcast_listen(): Listens for broadcast messages from clients.
-        stop_listen(): Sends a disconnect message to stop listening for broadcast messages.
+        stop_listen(): Stops listening for broadcast messages.
     """
 
     def __init__(self, app, gui, network):
@@ -789,13 +1433,10 @@ class Server:
             gui (Gui): Reference to the Gui instance.
             network (Network): Reference to the Network instance.
         """
-        self.app = app
-        self.gui = gui
-        self.network = network
+        super().__init__(app, gui, network)
         self.client_connected = False
         self.server_socket = None
-        self.client_socket = None
-        self.udp_socket = None
+        self.stop_event = threading.Event()
 
     def start(self):
         """Starts the server and waits for client connections.
@@ -803,39 +1444,23 @@ class Server:
         A connection facilitates game and chat communications.
         """
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server_socket = create_game_socket()
+            # Allow rebinding the port while connections from a previous session are in TIME_WAIT,
+            # Windows doesn't need it and there it lets other sockets bind a port that's in use
+            if sys.platform != "win32":
+                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.network.local_ip, self.network.server_port))
             self.server_socket.listen(1)
             print(f"Server listening on port {self.network.server_port}")
 
             self.client_socket, (client_ip, _) = self.server_socket.accept()
+            configure_game_socket(self.client_socket)
             print(f"Accepted connection from {client_ip}")
             self.app.gui.after(0, self.app.network_connected, client_ip)
             self.client_connected = True
 
-            while True:
-                data = self.client_socket.recv(1024)
-                if not data:
-                    break
+            self.message_loop()
 
-                if data.startswith(b"DISCONNECT"):
-                    game_state = data[len(b"DISCONNECT"):].decode("utf-8")
-                    if game_state == "mid_game":
-                        self.app.gui.after(0, self.app.dropout_resolution, "player")
-                    break
-                
-                if data.startswith(b"CHAT"):
-                    msg = data[len(b"CHAT"):].decode("utf-8")
-                    self.app.gui.after(0, self.app.network_chat, msg, "peer_chat")
-                
-                if data.startswith(b"GAME"):
-                    self.app.opponent_choice = data[len(b"GAME"):].decode("utf-8")
-                    if self.app.player_choice:
-                        self.app.gui.after(0, self.app.determine_results)
-                    else:
-                        self.app.gui.after(0, self.app.network_chat, 
-                                           f"{self.app.opponent_username} has chosen...\n", "system_chat")
-            
             self.client_socket.close()
             self.server_socket.close()
             
@@ -856,7 +1481,7 @@ class Server:
             game_state (str): The game state at the time of disconnection.
         """
         if self.client_connected:
-            self.client_socket.send(b"DISCONNECT" + game_state.encode("utf-8"))
+            send_frame(self.client_socket, OP_DISCONNECT, game_state.encode("utf-8"))
         else:
             self.server_socket.close()
 
@@ -864,53 +1489,57 @@ class Server:
         """Listens for broadcast messages from clients.
 
         Broadcast messages can be used for server discovery by clients.
+        Listening stops when a client connects or stop_listen is called.
+        stop_event must be cleared before this is submitted to a worker thread.
         """
         try:
             self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.udp_socket.bind(('', self.network.broadcast_port))
 
-            while True:
+            while not self.stop_event.is_set():
+                # Wait with a timeout so stop_event is checked regularly
+                readable, _, _ = select.select([self.udp_socket], [], [], 0.5)
+                if not readable:
+                    continue
+
                 data, addr = self.udp_socket.recvfrom(1024)
-                if data.startswith(b"LOOKUP"):
+                if data.startswith(LOOKUP_PREFIX):
                     data_to_send = f"{self.network.server_port},{self.app.user_profile['username']},{self.app.total_rounds}"
                     self.udp_socket.sendto(data_to_send.encode("utf-8"), addr)
 
-                if data.startswith(b"CONNECT"):
-                    data_values = data[len(b"CONNECT"):].decode('utf-8').split(',')
+                if data.startswith(CONNECT_PREFIX):
+                    data_values = data[len(CONNECT_PREFIX):].decode('utf-8').split(',')
                     if len(data_values) == 2:
                         requested_ip, username = data_values
                         if requested_ip == self.network.local_ip:
                             self.app.opponent_username = username
                             # Send an "ACK" response back to the sender
-                            self.udp_socket.sendto(b"ACK", addr)
-                            # Start the server and close the broadcast_thread by exiting loop
+                            self.udp_socket.sendto(ACK_PREFIX, addr)
+                            # Start the server and finish the broadcast task by exiting loop
                             self.app.gui.after(0, self.app.launch_server)
                             break
 
-                if data == b"DISCONNECT":
-                    if self.app.allow_gui_update:
-                        self.app.gui.after(0, self.app.network_disconnected)
-                    break  # Exit the loop when "DISCONNECT" message is received
+            else:
+                # Hosting was cancelled with stop_listen
+                if self.app.allow_gui_update:
+                    self.app.gui.after(0, self.app.network_disconnected)
         
         except Exception as e:
             CTkMessagebox(title="Hosting Connection Error", message=f"Error:\n{str(e)}", 
                           icon=self.gui.icon_cancel, master=self.gui, sound=True)
+            if self.app.allow_gui_update:
+                self.app.gui.after(0, self.app.network_disconnected)
 
         finally:
             self.udp_socket.close()
 
     def stop_listen(self):
-        """Sends a disconnect message to stop listening for broadcast messages.
+        """Stops listening for broadcast messages.
         """
-        try:
-            self.udp_socket.sendto(b"DISCONNECT", (self.network.local_ip, self.network.broadcast_port))
-
-        except Exception as e:
-            CTkMessagebox(title="Error Cancelling Hosting", message=f"Error:\n{str(e)}", 
-                          icon=self.gui.icon_cancel, master=self.gui, sound=True)
+        self.stop_event.set()
 
 
-class Client:
+class Client(Peer):
     """Manages client-side network communication.
 
     Attributes:
@@ -933,11 +1562,7 @@ class Client:
             gui (Gui): Reference to the Gui instance.
             network (Network): Reference to the Network instance.
         """
-        self.app = app
-        self.gui = gui
-        self.network = network
-        self.client_socket = None
-        self.udp_socket = None
+        super().__init__(app, gui, network)
 
     def start(self, server_ip, server_port):
         """Sends a connection request to a server through the broadcast address and 
@@ -950,44 +1575,22 @@ class Client:
             server_port (int): Port number of the server to connect to.
         """
         try:
-            self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.client_socket = create_game_socket()
             udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
             # Request a connection from the broadcast port of the server
             udp_socket.bind((self.network.local_ip, self.network.broadcast_port))
-            udp_socket.sendto(b"CONNECT" + f"{server_ip},{self.app.user_profile['username']}".encode("utf-8"), 
+            udp_socket.sendto(CONNECT_PREFIX + f"{server_ip},{self.app.user_profile['username']}".encode("utf-8"), 
                               (server_ip, self.network.broadcast_port)) 
             udp_socket.settimeout(5)
             response, addr = udp_socket.recvfrom(1024)
             udp_socket.close()
             
-            if response.startswith(b"ACK"):
+            if response.startswith(ACK_PREFIX):
                 # Establish connection to server
                 self.client_socket.connect((server_ip, server_port))
                 self.app.gui.after(0, self.app.network_connected, server_ip)
-                
-                while True:
-                    data = self.client_socket.recv(1024)
-                    if not data:
-                        break
-
-                    if data.startswith(b"DISCONNECT"):
-                        game_state = data[len(b"DISCONNECT"):].decode("utf-8")
-                        if game_state == "mid_game":
-                            self.app.gui.after(0, self.app.dropout_resolution, "player")
-                        break
-
-                    if data.startswith(b"CHAT"):
-                        msg = data[len(b"CHAT"):].decode("utf-8")
-                        self.app.gui.after(0, self.app.network_chat, msg, "peer_chat")
-                    
-                    if data.startswith(b"GAME"):
-                        self.app.opponent_choice = data[len(b"GAME"):].decode("utf-8")
-                        if self.app.player_choice:
-                            self.app.gui.after(0, self.app.determine_results)
-                        else:
-                            self.app.gui.after(0, self.app.network_chat, 
-                                               f"{self.app.opponent_username} has chosen...\n", "system_chat")
+                self.message_loop()
 
             else:
                 CTkMessagebox(title="Server Connection Error", message="Server didn't acknowledge the connection request", 
@@ -1009,7 +1612,7 @@ class Client:
         Args:
             game_state (str): The game state at the time of disconnection.
         """
-        self.client_socket.send(b"DISCONNECT" + game_state.encode("utf-8"))
+        send_frame(self.client_socket, OP_DISCONNECT, game_state.encode("utf-8"))
 
 
 class App:
@@ -1020,11 +1623,27 @@ class App:
         network (Network): Reference to the Network instance.
         server (Server): Reference to the Server instance.
         client (Client): Reference to the Client instance.
-        broadcast_thread (threading.Thread): Thread for broadcasting and listening to servers.
-        server_thread (threading.Thread): Thread for managing the server.
-        client_thread (threading.Thread): Thread for managing the client.
+        network_executor (ThreadPoolExecutor): Worker threads running the broadcast listener, 
+            server, client and server discovery.
+        discovery_future (Future): The running or last server discovery task.
+        role (str): The current network role ("host", "server" or "client"), or None when not connected.
         allow_gui_update (bool): Flag to allow GUI updates.
         user_data_path (str): Path to the user data file.
+        users (dict): Lists of saved user records loaded from the user data file, keyed by username.
+            Files saved by earlier versions can hold several accounts with the same username.
+        user_lines (list): Lines of the user data file as bytes, including any it couldn't parse.
+        user_line_numbers (dict): Index in user_lines of each user's record, keyed by (username, password).
+        stats_offsets (dict): Byte offsets of each user's counters in the user data file,
+            keyed by (username, password).
+        user_data_size (int): Size of the user data file in bytes.
+        user_data_stat (tuple): Size and modification time of the user data file when it was last read
+            or written, or None if it must be read again before the next write.
+            After startup user_lines, user_line_numbers, stats_offsets, user_data_size and user_data_stat
+            are only used by the io_executor thread.
+        user_data_loaded (bool): Whether the user data file was read completely. Writes to the file are
+            refused otherwise, as they would be based on an incomplete index.
+        io_executor (ThreadPoolExecutor): Single worker that writes the user data file in the background.
+        stats_save_job (str): Tk after id of the pending profile stats save, or None.
         selected_avatar (str): The selected avatar name.
         user_profile (dict): User profile data.
         opponent_username (str): Opponent's username.
@@ -1034,6 +1653,12 @@ class App:
         current_round (int): Current round number.
 
     Methods:
+        load_user_data(): Loads the saved users from the user data file.
+        read_user_data(): Reads the user data file into user_lines and indexes it.
+        index_user_data(): Parses user_lines into the saved users and their offsets.
+        user_data_signature(): Gets the size and modification time of the user data file.
+        sync_user_data(): Reads the user data file again if it changed since it was last read or written.
+        user_data_unavailable(): Warns that the user data file can't be written.
         event_login(event=None): Handles the login event.
         event_logout(): Logs the user out.
         event_add_newuser(): Displays the new user registration form.
@@ -1044,6 +1669,8 @@ class App:
         event_chat(event=None): Handles chat messages.
         event_ip_select(selected_option): Handles IP selection in the lobby.
         event_join_search(): Searches for available servers to join.
+        search_servers(): Discovers available servers and passes them to the GUI thread.
+        show_available_servers(servers): Displays the discovered servers in the listbox.
         event_join(): Joins a selected server.
         event_host_refresh(): Refreshes the host settings.
         event_host(): Hosts a game.
@@ -1057,7 +1684,11 @@ class App:
         determine_results(): Determines game results.
         dropout_resolution(actor): Handles dropout resolution.
         update_profile_stats(): Updates user profile statistics in the GUI.
+        schedule_stats_save(): Schedules a profile stats save once the stats stop changing.
         save_profile_stats(): Saves user profile statistics to the data file.
+        append_user_data(record): Appends a user record to the data file.
+        write_user_stats(record): Saves a user's counters to the data file.
+        user_data_error(e): Reports an error writing the data file.
         on_exit(): Handles application exit.
     """
 
@@ -1072,8 +1703,11 @@ class App:
         self.server = Server(self, self.gui, self.network)
         self.client = Client(self, self.gui, self.network)
 
-        # Path to user save data in system file storage
+        # Path to user save data in system file storage and the saved users it contains
         self.user_data_path = user_data_path()
+        self.load_user_data()
+        self.io_executor = ThreadPoolExecutor(max_workers=1)
+        self.stats_save_job = None
         
         # User details and game variables
         self.user_profile = None
@@ -1083,10 +1717,10 @@ class App:
         self.total_rounds = None
         self.current_round = None
 
-        # Server/client threads
-        self.broadcast_thread = None
-        self.server_thread = None
-        self.client_thread = None
+        # Server/client worker threads
+        self.network_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rps-network")
+        self.discovery_future = None
+        self.role = None
 
         # Selected Gui Elements
         self.selected_avatar = None
@@ -1120,10 +1754,101 @@ class App:
         self.gui.protocol("WM_DELETE_WINDOW", self.on_exit)
         self.allow_gui_update = True
 
+    def load_user_data(self):
+        """Loads the saved users from the user data file into users.
+
+        If the file can't be read, user_data_loaded stays False and no user data is written.
+        """
+        self.user_lines = []
+        self.user_data_stat = None
+        self.users = self.index_user_data()
+        self.user_data_loaded = False
+
+        try:
+            self.users = self.read_user_data()
+            self.user_data_loaded = True
+
+        except Exception as e:
+            self.user_lines = []
+            self.index_user_data()
+            CTkMessagebox(title="Load User Data Failed", message=f"An error occurred during file access:\n{str(e)}\n\n" \
+                          "Changes to user data won't be saved.", icon=self.gui.icon_cancel, master=self.gui, sound=True)
+
+    def read_user_data(self):
+        """Reads the user data file into user_lines and indexes it.
+
+        Runs at startup, and in the io_executor thread when the file changed since it was last read or written.
+
+        Returns:
+            dict: The saved users, as returned by index_user_data.
+        """
+        # Taken before reading, so a change made while the file is read is picked up by the next sync
+        self.user_data_stat = None
+        signature = self.user_data_signature()
+        with open(self.user_data_path, "rb") as file:
+            self.user_lines = file.readlines()
+
+        users = self.index_user_data()
+        self.user_data_stat = signature
+        return users
+
+    def index_user_data(self):
+        """Parses user_lines into user_line_numbers, stats_offsets and user_data_size.
+
+        Counter offsets are only recorded for lines already in the fixed-width format.
+        Lines that can't be parsed are skipped but kept in user_lines, so rewrites preserve them.
+
+        Returns:
+            dict: Lists of the saved user records, keyed by username.
+        """
+        users = {}
+        self.user_line_numbers = {}
+        self.stats_offsets = {}
+        self.user_data_size = 0
+
+        for i, raw_line in enumerate(self.user_lines):
+            parts = decode_user_line(raw_line).strip().split(", ")
+            key = tuple(parts[:2])
+            if len(parts) >= 6 and key not in self.user_line_numbers:
+                users.setdefault(parts[0], []).append(parts)
+                self.user_line_numbers[key] = i
+                line, stats_offset = format_user_record(parts)
+                if line == raw_line and stats_offset is not None:
+                    self.stats_offsets[key] = self.user_data_size + stats_offset
+            self.user_data_size += len(raw_line)
+
+        return users
+
+    def user_data_signature(self):
+        """Gets the size and modification time of the user data file.
+
+        Returns:
+            tuple: The file size in bytes and modification time in nanoseconds.
+        """
+        stat = os.stat(self.user_data_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def sync_user_data(self):
+        """Reads the user data file again if it changed since it was last read or written.
+
+        Runs in the io_executor thread before every write, so offsets are never used after another
+        instance of the app changed the file or a previous write failed.
+        """
+        if self.user_data_stat is None or self.user_data_signature() != self.user_data_stat:
+            self.read_user_data()
+
+    def user_data_unavailable(self):
+        """Warns that the user data file can't be written because it wasn't loaded completely.
+        """
+        CTkMessagebox(title="Save User Data Failed", message="User data could not be loaded at startup, " \
+                      "so changes can't be saved.\nRestart the app to try again.", 
+                      icon=self.gui.icon_cancel, master=self.gui)
+
     def event_login(self, event=None):
         """Event handler for the "Login" button on the login screen.
 
-        Checks username and hashed password against saved users in the user data file.
+        Checks username and hashed password against the saved users loaded from the user data file,
+        accepting any saved account with that username whose password matches.
         Successful login loads the user profile and shows the main screen.
 
         Args:
@@ -1131,45 +1856,34 @@ class App:
         """
         self.gui.login_button.focus_set()
         username = self.gui.login_username.get()
-        password = hashlib.sha256(self.gui.login_password.get().encode()).hexdigest()
-        user_found = False
+        password = self.gui.login_password.get()
+        parts = next((user for user in self.users.get(username, ()) if check_password(password, user[1])), None)
 
         try:
-            with open(self.user_data_path, "r") as file:
-                for line in file:
-                    parts = line.strip().split(", ")
-                    if parts[0] == username and parts[1] == password:
-                        user_found = True
-                        
-                        # Save logged in user data to the user_profile list
-                        self.user_profile = {
-                            "username": parts[0],
-                            "password": parts[1],
-                            "avatar": parts[2],
-                            "wins": int(parts[3]),
-                            "loses": int(parts[4]),
-                            "ties": int(parts[5]),
-                        }
-
-                        # Show main screen
-                        self.gui.show_main_screen()
-
-                        # Get user details for display in the main screen
-                        self.gui.profile_button.configure(text=f" {self.user_profile['username']} ", 
-                                              image=self.gui.images_avatar.get(self.user_profile['avatar']))
-                        self.update_profile_stats()
-                        self.network.get_local_ip()
-                        self.gui.lobby_host_ip_label2.configure(text=self.network.local_ip)
-
-                        break
-
-            if not user_found:
+            if parts:
+                # Save logged in user data to the user_profile list
+                self.user_profile = {
+                    "username": parts[0],
+                    "password": parts[1],
+                    "avatar": parts[2],
+                    "wins": int(parts[3]),
+                    "loses": int(parts[4]),
+                    "ties": int(parts[5]),
+                }
+
+                # Show main screen
+                self.gui.show_main_screen()
+
+                # Get user details for display in the main screen
+                self.gui.profile_button.configure(text=f" {self.user_profile['username']} ", 
+                                      image=self.gui.avatar_image(self.user_profile['avatar']))
+                self.update_profile_stats()
+                self.network.get_local_ip()
+                self.gui.lobby_host_ip_label2.configure(text=self.network.local_ip)
+            else:
                 CTkMessagebox(title="Login Failed", message="User not found", icon=self.gui.icon_warning, master=self.gui)
-        except FileNotFoundError:
-            CTkMessagebox(title="Login Failed", message="File not found: user_data.txt", 
-                          icon=self.gui.icon_cancel, master=self.gui, sound=True)
         except Exception as e:
-            CTkMessagebox(title="Login Failed", message=f"An error occurred during file access:\n{str(e)}", 
+            CTkMessagebox(title="Login Failed", message=f"An error occurred while loading user data:\n{str(e)}", 
                           icon=self.gui.icon_cancel, master=self.gui, sound=True)
 
     def event_logout(self):
@@ -1178,7 +1892,9 @@ class App:
 
         Logs out the user, hides all frames except the login frame, and clears user-related data.
         """
-        # Hide all frames except login frame
+        # Stop any server search and hide all frames except login frame
+        if self.discovery_future and not self.discovery_future.done():
+            self.network.cancel_discovery()
         self.gui.show_login_screen()
 
         # Clear user_profile list, input fields and reset placeholder text
@@ -1211,7 +1927,8 @@ class App:
         """Event handler for the "Save" button on the newuser screen.
 
         Save a new user's registration data and login the user.
-        Performs input validation, checks for duplicate users, and writes the user's data to file.
+        Performs input validation, checks for duplicate users, and writes the user's data to file 
+        in the io_executor thread.
 
         Args:
             event (optional): Defaults to None - enables binding of enter key to button.
@@ -1224,72 +1941,59 @@ class App:
         save_valid = True
         error_msg = ""
 
-        try:
-            # Check if user already exists in user_data.txt file
-            with open(self.user_data_path, "r") as file:
-                for line in file:
-                    parts = line.strip().split(", ")
-                    if parts[0] == username and parts[1] == password:
-                        error_msg += "User already exists\n"
-                        save_valid = False
-                        file.close()
-                        break
-
-            # Input validation checks  
-            if save_valid:
-                error_msg += "Invalid fields found:\n"
-                if self.selected_avatar is None:
-                    error_msg += "\u2022 No avatar selected\n"
-                    save_valid = False
-                if not username:
-                    error_msg += "\u2022 Username field empty\n"
-                    save_valid = False
-                elif len(username) < 2 or len(username) > 14:
-                    error_msg += "\u2022 Username must be 2-14 char long\n"
-                    save_valid = False
-                if not password:
-                    error_msg += "\u2022 Password field empty\n"
-                    save_valid = False
-                if not password2:
-                    error_msg += "\u2022 Repeat password field empty\n"
-                    save_valid = False
-                if password != password2:
-                    error_msg += "\u2022 Passwords don't match\n"
-                    save_valid = False
-                if ',' in username or ',' in password or ',' in password2:
-                    error_msg += "\u2022 Fields cannot contain a comma\n"
-            
-            # Password requirements
-            if save_valid:
-                if not re.match(r'^(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>])(.{8,})$', password):
-                    error_msg = "Password must contain:\n"
-                    error_msg += "\u2022 At least 8 characters\n"
-                    error_msg += "\u2022 At least one number\n"
-                    error_msg += "\u2022 At least one symbol\n"
-                    save_valid = False
-
-            # Write user details to user_data.txt file and login user
-            if save_valid:
-                hashed_password = hashlib.sha256(password.encode()).hexdigest()
-                with open(self.user_data_path, "a") as file:
-                    file.write(f"{username}, {hashed_password}, " \
-                               f"{self.selected_avatar}, 0, 0, 0\n")
-                    file.close()
-
-                    self.gui.login_username.delete(0, END)
-                    self.gui.login_password.delete(0, END)
-                    self.gui.login_username.insert(0, username)
-                    self.gui.login_password.insert(0, password)
-                    self.event_login()
-            else:
-                CTkMessagebox(title="Save User Failed", message=error_msg.rstrip('\n'), icon=self.gui.icon_info, master=self.gui)
-
-        except FileNotFoundError:
-            CTkMessagebox(title="Save Data Access Failed", message="File not found: user_data.txt", 
-                          icon=self.gui.icon_cancel, master=self.gui)
-        except Exception as e:
-            CTkMessagebox(title="Save Data Access Failed Failed", message=f"An error occurred during file access:\n {str(e)}", 
-                          icon=self.gui.icon_cancel, master=self.gui)
+        # Check if user already exists in the saved users
+        if username in self.users:
+            error_msg += "User already exists\n"
+            save_valid = False
+
+        # Input validation checks  
+        if save_valid:
+            error_msg += "Invalid fields found:\n"
+            if self.selected_avatar is None:
+                error_msg += "\u2022 No avatar selected\n"
+                save_valid = False
+            if not username:
+                error_msg += "\u2022 Username field empty\n"
+                save_valid = False
+            elif len(username) < 2 or len(username) > 14:
+                error_msg += "\u2022 Username must be 2-14 char long\n"
+                save_valid = False
+            if not password:
+                error_msg += "\u2022 Password field empty\n"
+                save_valid = False
+            if not password2:
+                error_msg += "\u2022 Repeat password field empty\n"
+                save_valid = False
+            if password != password2:
+                error_msg += "\u2022 Passwords don't match\n"
+                save_valid = False
+            if ',' in username or ',' in password or ',' in password2:
+                error_msg += "\u2022 Fields cannot contain a comma\n"
+        
+        # Password requirements
+        if save_valid:
+            if not PASSWORD_RE.match(password):
+                error_msg = "Password must contain:\n"
+                error_msg += "\u2022 At least 8 characters\n"
+                error_msg += "\u2022 At least one number\n"
+                error_msg += "\u2022 At least one symbol\n"
+                save_valid = False
+
+        # Write user details to user_data.txt file and login user
+        if save_valid and not self.user_data_loaded:
+            self.user_data_unavailable()
+        elif save_valid:
+            record = [username, hash_password(password), self.selected_avatar, pad_stat(0), pad_stat(0), pad_stat(0)]
+            self.users[username] = [record]
+            self.io_executor.submit(self.append_user_data, record)
+
+            self.gui.login_username.delete(0, END)
+            self.gui.login_password.delete(0, END)
+            self.gui.login_username.insert(0, username)
+            self.gui.login_password.insert(0, password)
+            self.event_login()
+        else:
+            CTkMessagebox(title="Save User Failed", message=error_msg.rstrip('\n'), icon=self.gui.icon_info, master=self.gui)
 
     def event_profile(self):
         """Event hanlder for the "Profile Options" button on the main screen.
@@ -1297,7 +2001,7 @@ class App:
         Opens a message box displaying profile options such as logout, exit, and cancel.
         Depending on the user's choice, it triggers the corresponding event.
         """
-        msg = CTkMessagebox(title="Profile Options", message=f"Rock - Paper - Scissors\n\nVersion 2.3\n2023\nLuke Wait", 
+        msg = CTkMessagebox(title="Profile Options", message="Rock - Paper - Scissors\n\nVersion 2.3\n2023\nLuke Wait", 
                             icon=self.gui.icon_info, option_1="Logout", option_2="Exit", option_3="Cancel", master=self.gui)
         
         if msg.get() == "Logout":
@@ -1317,10 +2021,10 @@ class App:
         self.gui.game_rps_button.configure(state="disabled")
         self.player_choice = value
 
-        if self.server_thread and self.server_thread.is_alive():
-            self.server.client_socket.send(b"GAME" + value.encode("utf-8"))
-        elif self.client_thread and self.client_thread.is_alive():
-            self.client.client_socket.send(b"GAME" + value.encode("utf-8"))
+        if self.role == "server":
+            self.server.client_socket.sendall(GAME_FRAMES[value])
+        elif self.role == "client":
+            self.client.client_socket.sendall(GAME_FRAMES[value])
 
         if self.opponent_choice:
             self.determine_results()
@@ -1335,14 +2039,14 @@ class App:
         Args:
             event (optional): Defaults to None - enables binding of enter key to button.
         """
-        msg = self.gui.game_chatbox.get()
+        msg = self.gui.game_chatbox.get().translate(CHAT_STRIP_TABLE)
         
         if msg:
             self.network_chat(msg, "local_chat")
-            if self.server_thread and self.server_thread.is_alive():
-                self.server.client_socket.send(b"CHAT" + msg.encode("utf-8"))
-            elif self.client_thread and self.client_thread.is_alive():
-                self.client.client_socket.send(b"CHAT" + msg.encode("utf-8"))
+            if self.role == "server":
+                send_frame(self.server.client_socket, OP_CHAT, msg.encode("utf-8"))
+            elif self.role == "client":
+                send_frame(self.client.client_socket, OP_CHAT, msg.encode("utf-8"))
 
     def event_ip_select(self, selected_option):
         """Event handler for the listbox in the join tab of the lobby section.
@@ -1357,19 +2061,46 @@ class App:
     def event_join_search(self):
         """Event handler for the "Search" button in the join tab of the lobby section.
 
-        Clears the listbox, retrieves the available servers using discover_servers, 
-        and populates the listbox with any responses from listening servers.
+        Clears the listbox and retrieves the available servers on the network_executor,
+        which populates the listbox with any responses from listening servers.
         """
         if self.gui.lobby_join_listbox.size() > 0:
             self.gui.lobby_join_listbox.delete(0, END)
             self.gui.lobby_join_button.configure(state="disabled")
 
-        self.available_servers = self.network.discover_servers()
+        self.gui.lobby_join_search_button.configure(state="disabled")
+        self.discovery_future = self.network_executor.submit(self.search_servers)
+
+    def search_servers(self):
+        """Discovers available servers and passes them to the GUI thread for display.
+
+        Runs on the network_executor.
+        """
+        servers = self.network.discover_servers()
+        if self.allow_gui_update:
+            self.gui.after(0, self.show_available_servers, servers)
+
+    def show_available_servers(self, servers):
+        """Populates the listbox with the servers found by search_servers.
+
+        Results are discarded if the user logged out, or the lobby was disabled by hosting
+        or connecting, during the search.
+
+        Args:
+            servers (list): Available servers as returned by discover_servers.
+        """
+        # A disabled lobby re-enables the search button itself when it's set back to normal
+        if self.gui.lobby_frame_state == "disabled":
+            return
+        self.gui.lobby_join_search_button.configure(state="normal")
+        if self.user_profile is None:
+            return
+
+        self.available_servers = servers
         if self.available_servers:
-            for i, server in enumerate(self.available_servers):
-                display_text = f"Username: {server[2]}\nTotal Rounds: {server[3]}\n" \
-                            f"IP: {server[0]}\nPort: {server[1]}"
-                self.gui.lobby_join_listbox.insert(i, display_text)
+            entries = [SERVER_ENTRY.format(*server) for server in self.available_servers]
+            for i, entry in enumerate(entries):
+                self.gui.lobby_join_listbox.insert(i, entry)
         else:
             self.gui.update_status_textbox("No servers found")
 
@@ -1388,15 +2119,15 @@ class App:
         self.opponent_username = self.available_servers[index][2]
         self.total_rounds = int(self.available_servers[index][3])
 
-        self.client_thread = threading.Thread(target=lambda: self.client.start(server_ip, server_port))
-        self.client_thread.start()
+        self.role = "client"
+        self.network_executor.submit(self.client.start, server_ip, server_port)
 
     def event_host_refresh(self):
         """Event handler for the "Refresh" button in the host tab of the lobby section.
         
         Refresh the host settings and update the IP address in the lobby.
         """
-        self.network.get_local_ip()
+        self.network.get_local_ip(force=True)
         self.gui.lobby_host_ip_label2.configure(text=self.network.local_ip)
         self.gui.lobby_host_slider.set(3)
 
@@ -1410,10 +2141,12 @@ class App:
         self.network.get_local_ip()
         self.gui.lobby_host_ip_label2.configure(text=self.network.local_ip)
 
-        self.broadcast_thread = threading.Thread(target=self.server.broadcast_listen)
-        self.broadcast_thread.start()
+        self.role = "host"
+        # Clear before submitting so a cancel made before the worker starts isn't lost
+        self.server.stop_event.clear()
+        self.network_executor.submit(self.server.broadcast_listen)
 
-        self.gui.update_status_textbox(f"Hosting at:\n" \
+        self.gui.update_status_textbox("Hosting at:\n" \
                                        f"IP: {self.network.local_ip}\n" \
                                        f"Port: {self.network.server_port}")
         self.gui.update_lobby_state("disabled")
@@ -1440,8 +2173,8 @@ class App:
         serverport_input = self.gui.lobby_settings_serverport.get()
         broadport_input = self.gui.lobby_settings_broadport.get()
 
-        if (serverport_input and not re.match(r'^\d{1,5}$', serverport_input)) or \
-           (broadport_input and not re.match(r'^\d{1,5}$', broadport_input)):
+        if (serverport_input and not PORT_RE.match(serverport_input)) or \
+           (broadport_input and not PORT_RE.match(broadport_input)):
             CTkMessagebox(title="Invalid Input", message="Port fields must be valid integers with a maximum length of 5", 
                           icon=self.gui.icon_info, master=self.gui)
             return
@@ -1454,14 +2187,8 @@ class App:
             self.network.broadcast_port = int(self.gui.lobby_settings_broadport.get())
             self.gui.lobby_settings_broadport.delete(0, END)
             self.gui.lobby_settings_broadport.configure(placeholder_text=f"{self.network.broadcast_port}") 
-        if self.gui.lobby_settings_audio_switch:
-            self.gui.audio_on = True
-        else:
-            self.gui.audio_on = False
-        if self.gui.lobby_settings_tts_switch:
-            self.gui.tts_on = True
-        else:
-            self.gui.tts_on = False
+        self.gui.audio_on = bool(self.gui.lobby_settings_audio_switch.get())
+        self.gui.tts_on = bool(self.gui.lobby_settings_tts_switch.get())
         CTkMessagebox(title="Settings Saved", message="Settings successfully updated", 
                           icon=self.gui.icon_check, master=self.gui)
 
@@ -1476,30 +2203,32 @@ class App:
             scope (str): The scope of disconnection, which can be "logout" or "exit". Default is None.
         """
         if self.current_round:
-            msg = CTkMessagebox(title="Disconnect From Peer", message=f"Are you sure you want to disconnect mid-game?\n\n" \
+            msg = CTkMessagebox(title="Disconnect From Peer", message="Are you sure you want to disconnect mid-game?\n\n" \
                         f"You will forfeit any incomplete rounds: {self.total_rounds - (self.current_round - 1)}", 
                         icon=self.gui.icon_question, option_1="Proceed", option_2="Cancel", master=self.gui, sound=True)
             
             if msg.get() == "Proceed":
-                if self.server_thread and self.server_thread.is_alive():
+                if self.role == "server":
                     self.server.stop("mid_game")
-                elif self.client_thread and self.client_thread.is_alive():
+                elif self.role == "client":
                     self.client.stop("mid_game")
                 self.dropout_resolution("quitter")
             if msg.get() == "Cancel":
                 return
 
         else:
-            if self.broadcast_thread and self.broadcast_thread.is_alive():
+            if self.role == "host":
                 self.server.stop_listen()
-            elif self.server_thread and self.server_thread.is_alive():
+            elif self.role == "server":
                 self.server.stop("no_game")
-            elif self.client_thread and self.client_thread.is_alive():
+            elif self.role == "client":
                 self.client.stop("no_game")
             
         if scope == "exit":
             if self.user_profile:
                 self.save_profile_stats()
+            # Wait for pending user data writes before closing
+            self.io_executor.shutdown()
             self.gui.destroy()
         elif scope == "logout":
             self.save_profile_stats()
@@ -1508,8 +2237,8 @@ class App:
     def launch_server(self):
         """Launch the game server in a separate thread.
         """
-        self.server_thread = threading.Thread(target=self.server.start)
-        self.server_thread.start()
+        self.role = "server"
+        self.network_executor.submit(self.server.start)
 
     def network_connected(self, peer_ip):
         """Called when a successful network connection is established. 
@@ -1520,13 +2249,13 @@ class App:
             peer_ip (str): The IP address of the connected peer.
         """
         self.current_round = 1
-        self.gui.update_status_textbox(f"Connection successful\n" \
+        self.gui.update_status_textbox("Connection successful\n" \
                                        f"Local IP: {self.network.local_ip}\n" \
                                        f"Peer  IP: {peer_ip}")
         self.gui.update_main_textbox(f"{self.user_profile['username']} Vs. {self.opponent_username}\n\n" \
-                                     f"##########################################\n\n" \
-                                     f"Round {self.current_round} / {self.total_rounds}\n" \
-                                     f"**************\n", "system_chat")
+                                     "##########################################\n\n" + \
+                                     ROUND_HEADER.format(round=self.current_round, total=self.total_rounds), 
+                                     "system_chat")
         self.gui.update_game_state("normal")
         self.gui.update_lobby_state("disabled")
 
@@ -1542,6 +2271,7 @@ class App:
         self.gui.update_game_state("disabled")
         self.gui.update_lobby_state("normal")
 
+        self.role = None
         self.player_choice = None
         self.opponent_choice = None
         self.opponent_username = None
@@ -1566,29 +2296,25 @@ class App:
         Determines if it is the final round and either resets the game functions for another round,
         or disconnects the client from the server as the game session is completed.
         """
-        choices = {"Rock": 0, "Paper": 1, "Scissors": 2}
-        result = (choices[self.player_choice] - choices[self.opponent_choice]) % 3
-
-        if result == 0:
-            self.user_profile["ties"] += 1
-        elif result == 1:
-            self.user_profile["wins"] += 1
-        else:
-            self.user_profile["loses"] += 1
+        result = (CHOICE_ID[self.player_choice] - CHOICE_ID[self.opponent_choice]) % 3
+        self.user_profile[RESULT_KEYS[result]] += 1
         
         self.update_profile_stats()
-        self.network_chat(self.gui.ascii_results(self.player_choice, self.opponent_choice), "system_chat")
+        self.schedule_stats_save()
+        results = self.gui.ascii_results(self.player_choice, self.opponent_choice)
 
         if self.current_round < self.total_rounds:
             self.current_round += 1
-            self.gui.update_main_textbox(f"Round {self.current_round} / {self.total_rounds}\n" \
-                                         f"**************\n", "system_chat")
+            # Show the results and the next round header in a single textbox update
+            self.network_chat(results + "\n" + ROUND_HEADER.format(round=self.current_round, total=self.total_rounds), 
+                              "system_chat")
             self.gui.game_rps_button.configure(state="normal")
             self.gui.game_rps_button.set("unselect")
             self.player_choice = None
             self.opponent_choice = None
         else:
-            if self.server_thread and self.server_thread.is_alive():
+            self.network_chat(results, "system_chat")
+            if self.role == "server":
                 self.server.stop("game_complete")
 
     def dropout_resolution(self, actor):
@@ -1606,11 +2332,13 @@ class App:
             self.gui.update_main_textbox(f"{self.opponent_username} dropped out\n You've been credited {rounds} wins!\n", 
                                          "system_chat")
             self.update_profile_stats()
+            self.schedule_stats_save()
         elif actor == "quitter":
             self.user_profile["loses"] += rounds
             self.gui.update_main_textbox(f"You dropped out\n You've forfeited {rounds} rounds!\n", 
                                          "system_chat")
             self.update_profile_stats()
+            self.schedule_stats_save()
         
     def update_profile_stats(self):
         """Update the user's profile stats on the main screen.
@@ -1619,34 +2347,125 @@ class App:
                                                           f"Loses: {self.user_profile['loses']} / " \
                                                           f"Ties: {self.user_profile['ties']} ")
         
+    def schedule_stats_save(self):
+        """Schedules a save of the user's profile stats.
+
+        Saves are delayed until the stats have not changed for STATS_SAVE_DELAY, 
+        so consecutive rounds result in a single write.
+        """
+        if self.stats_save_job:
+            self.gui.after_cancel(self.stats_save_job)
+        self.stats_save_job = self.gui.after(STATS_SAVE_DELAY, self.save_profile_stats)
+
     def save_profile_stats(self):
         """Save the user's profile stats to the user data file.
 
-        Reads the file, updates the stats, and writes them back to the file.
+        Updates the saved user record and, if it changed, writes it to the file in the io_executor thread.
+        """
+        if self.stats_save_job:
+            self.gui.after_cancel(self.stats_save_job)
+            self.stats_save_job = None
+        if not self.user_data_loaded:
+            print("Error:\nUser data was not loaded, profile stats not saved")
+            return
+
+        key = (self.user_profile["username"], self.user_profile["password"])
+        record = [*key, self.user_profile["avatar"], 
+                  pad_stat(self.user_profile['wins']), pad_stat(self.user_profile['loses']), 
+                  pad_stat(self.user_profile['ties'])]
+        records = self.users[key[0]]
+        index = next(i for i, user in enumerate(records) if user[1] == key[1])
+        if records[index] == record:
+            return
+        records[index] = record
+        self.io_executor.submit(self.write_user_stats, record)
+
+    def append_user_data(self, record):
+        """Appends a user record to the user data file.
+
+        Runs in the io_executor thread.
+
+        Args:
+            record (list): The user record as [username, password, avatar, wins, loses, ties] strings.
         """
         try:
-            with open(self.user_data_path, "r") as file:
-                lines = file.readlines()
-
-            for i, line in enumerate(lines):
-                parts = line.strip().split(", ")
-                if parts[0] == self.user_profile["username"] and parts[1] == self.user_profile["password"]:
-                    parts[3] = str(self.user_profile['wins'])
-                    parts[4] = str(self.user_profile['loses'])
-                    parts[5] = str(self.user_profile['ties'])
-                    updated_line = ", ".join(parts) + "\n"
-                    lines[i] = updated_line
-                    break
+            self.sync_user_data()
+            line, stats_offset = format_user_record(record)
+            data = line
+            if self.user_lines and not self.user_lines[-1].endswith(b"\n"):
+                # Terminate the last line so the new record starts on its own line
+                self.user_lines[-1] += b"\n"
+                self.user_data_size += 1
+                data = b"\n" + line
+
+            with open(self.user_data_path, "ab") as file:
+                file.write(data)
+
+            key = tuple(record[:2])
+            if key not in self.user_line_numbers:
+                self.user_line_numbers[key] = len(self.user_lines)
+                if stats_offset is not None:
+                    self.stats_offsets[key] = self.user_data_size + stats_offset
+            self.user_lines.append(line)
+            self.user_data_size += len(line)
+            self.user_data_stat = self.user_data_signature()
 
-            with open(self.user_data_path, "w") as file:
-                file.writelines(lines)
+        except Exception as e:
+            # Read the file again before the next write, as the index may no longer match it
+            self.user_data_stat = None
+            self.user_data_error(e)
+
+    def write_user_stats(self, record):
+        """Saves a user's counters to the user data file.
+
+        Runs in the io_executor thread.
+        The counters are overwritten in place when their offset is known, otherwise the file is
+        rewritten with the user's line replaced in the fixed-width format and all other lines kept as they are.
+
+        Args:
+            record (list): The user record as [username, password, avatar, wins, loses, ties] strings.
+        """
+        try:
+            self.sync_user_data()
+            key = tuple(record[:2])
+            line_no = self.user_line_numbers.get(key)
+            if line_no is None:
+                # Another instance removed the record from the file, so it's saved again
+                self.append_user_data(record)
+                return
+
+            line, stats_offset = format_user_record(record)
+            offset = self.stats_offsets.get(key)
+            if offset is not None and stats_offset is not None and len(line) == len(self.user_lines[line_no]):
+                with open(self.user_data_path, "r+b") as file:
+                    file.seek(offset)
+                    file.write(", ".join(record[3:6]).encode("utf-8"))
+                self.user_lines[line_no] = line
+            else:
+                # Replace only this user's line and index the offsets again, as later lines may have moved
+                self.user_lines[line_no] = line
+                with open(self.user_data_path, "wb") as file:
+                    file.write(b"".join(self.user_lines))
+                self.index_user_data()
+            self.user_data_stat = self.user_data_signature()
 
-        except FileNotFoundError:
-            CTkMessagebox(title="Save Profile Failed", message="File not found: user_data.txt", 
-                          icon=self.gui.icon_cancel, master=self.gui, sound=True)
         except Exception as e:
-            CTkMessagebox(title="Save Profile Failed", message=f"An error occurred during file access:\n{str(e)}", 
-                          icon=self.gui.icon_cancel, master=self.gui, sound=True)
+            # Read the file again before the next write, as the index may no longer match it
+            self.user_data_stat = None
+            self.user_data_error(e)
+
+    def user_data_error(self, e):
+        """Reports an error writing the user data file from the io_executor thread.
+
+        Args:
+            e (Exception): The error raised.
+        """
+        message = f"An error occurred during file access:\n{str(e)}"
+        if self.allow_gui_update:
+            self.gui.after(0, lambda: CTkMessagebox(title="Save User Data Failed", message=message, 
+                                                    icon=self.gui.icon_cancel, master=self.gui, sound=True))
+        else:
+            print(f"Error:\n{str(e)}")
 
     def on_exit(self):
         """Called when the program is exited.
@@ -1654,6 +2473,8 @@ class App:
         Stops any running threads and performs necessary cleanup.
         """
         self.allow_gui_update = False
+        if self.discovery_future and not self.discovery_future.done():
+            self.network.cancel_discovery()
         self.event_disconnect("exit")
 
 
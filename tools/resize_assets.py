@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-resizes the GUI images to the sizes they are displayed at, so the app can load
+them at startup without resampling. The resized copies are saved to assets/images/sized.
+
+Run from the project main directory after changing an image or its display size:
+    python tools/resize_assets.py
+"""
+
+import os
+import sys
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from rps_app import Gui, LazyImage, presized_image_path
+
+def resize_image(images_path, filename, size):
+    """Saves a copy of an image resized to its display size.
+
+    Args:
+        images_path (str): Path to the directory containing the source image.
+        filename (str): The name of the image file.
+        size (tuple): The display size of the image (width, height).
+
+    Returns:
+        str: The path to the resized image.
+    """
+    sized_path = presized_image_path(images_path, filename, size)
+    os.makedirs(os.path.dirname(sized_path), exist_ok=True)
+
+    with Image.open(os.path.join(images_path, filename)) as image:
+        image.resize(size, Image.LANCZOS).save(sized_path, quality=90)
+
+    return sized_path
+
+
+if __name__ == "__main__":
+    images_path = os.path.join("assets", "images")
+    for attribute in vars(Gui).values():
+        if isinstance(attribute, LazyImage):
+            print(resize_image(images_path, attribute.filename, attribute.size))